@@ -9,8 +9,7 @@ This software is licensed under the MIT License.
 """
 
 from os import PathLike
-from collections import deque
-from typing import Optional, Union, Iterator
+from typing import Optional, TextIO, Union, Iterator
 
 from splurge_tools.string_tokenizer import StringTokenizer
 from splurge_tools.text_file_helper import TextFileHelper
@@ -164,7 +163,7 @@ class DsvHelper:
     @classmethod
     def parse_stream(
         cls,
-        file_path: Union[PathLike, str],
+        file_path: Union[PathLike, str, TextIO],
         delimiter: str,
         *,
         strip: bool = True,
@@ -178,13 +177,16 @@ class DsvHelper:
         """
         Stream-parse a DSV file in chunks of lines.
 
+        An open text stream (e.g. io.StringIO) is parsed from its current position
+        and is left open for the caller to close.
+
         Args:
-            file_path (Union[PathLike, str]): The path to the file to parse.
+            file_path (Union[PathLike, str, TextIO]): The path to the file to parse, or an open text stream.
             delimiter (str): The delimiter to use.
             strip (bool): Whether to strip whitespace from the strings.
             bookend (Optional[str]): The bookend to use for text fields.
             bookend_strip (bool): Whether to strip whitespace from the bookend.
-            encoding (str): The file encoding.
+            encoding (str): The file encoding (ignored for an open text stream).
             skip_header_rows (int): Number of header rows to skip.
             skip_footer_rows (int): Number of footer rows to skip.
             chunk_size (int): Number of lines per chunk (default: 100).
@@ -204,59 +206,22 @@ class DsvHelper:
         if skip_header_rows < 0 or skip_footer_rows < 0:
             raise ValueError("skip_header_rows and skip_footer_rows must be >= 0.")
 
-        with open(file_path, "r", encoding=encoding) as stream:
-            # Skip header rows
-            for _ in range(skip_header_rows):
-                if not stream.readline():
-                    return
-
-            # If skipping footer rows, use a buffer
-            if skip_footer_rows > 0:
-                buffer = deque()  
-                chunk = []  
-                for line in stream:
-                    buffer.append(line.strip() if strip else line.rstrip("\n"))
-                    if len(buffer) > skip_footer_rows:
-                        chunk.append(buffer.popleft())
-                        if len(chunk) == chunk_size:
-                            yield cls.parses(
-                                chunk,
-                                delimiter,
-                                strip=strip,
-                                bookend=bookend,
-                                bookend_strip=bookend_strip
-                            )
-                            chunk = []
-                # Yield any remaining chunk (excluding footer rows)
-                if chunk:
-                    yield cls.parses(
-                        chunk,
-                        delimiter,
-                        strip=strip,
-                        bookend=bookend,
-                        bookend_strip=bookend_strip
-                    )
-            else:
-                chunk = []
-                for line in stream:
-                    chunk.append(line.strip() if strip else line.rstrip("\n"))
-                    if len(chunk) == chunk_size:
-                        yield cls.parses(
-                            chunk,
-                            delimiter,
-                            strip=strip,
-                            bookend=bookend,
-                            bookend_strip=bookend_strip
-                        )
-                        chunk = []
-                if chunk:
-                    yield cls.parses(
-                        chunk,
-                        delimiter,
-                        strip=strip,
-                        bookend=bookend,
-                        bookend_strip=bookend_strip
-                    )
+        # Line reading, header/footer skipping and chunking are shared with TextFileHelper
+        for chunk in TextFileHelper.load_as_stream(
+            file_path,
+            strip=strip,
+            encoding=encoding,
+            skip_header_rows=skip_header_rows,
+            skip_footer_rows=skip_footer_rows,
+            chunk_size=chunk_size
+        ):
+            yield cls.parses(
+                chunk,
+                delimiter,
+                strip=strip,
+                bookend=bookend,
+                bookend_strip=bookend_strip
+            )
 
     @classmethod
     def profile_columns(
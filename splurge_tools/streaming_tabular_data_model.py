@@ -10,7 +10,7 @@ This module is licensed under the MIT License.
 """
 
 import re
-from typing import Generator, Iterator
+from typing import Any, Generator, Iterator, Optional
 
 from splurge_tools.type_helper import DataType, profile_values
 
@@ -29,7 +29,8 @@ class StreamingTabularDataModel:
         *,
         header_rows: int = 1,
         skip_empty_rows: bool = True,
-        chunk_size: int = 1000
+        chunk_size: int = 1000,
+        column_names: Optional[list[str]] = None
     ) -> None:
         """
         Initialize StreamingTabularDataModel.
@@ -39,6 +40,9 @@ class StreamingTabularDataModel:
             header_rows (int): Number of header rows to merge into column names.
             skip_empty_rows (bool): Skip empty rows in data.
             chunk_size (int): Maximum number of rows to keep in memory buffer (minimum 100).
+            column_names (Optional[list[str]]): Known column names, used instead of deriving them. Any
+                header rows are still consumed from the stream but not merged into names; without header
+                rows, no column_<index> names are generated from the first row.
 
         Raises:
             ValueError: If stream or header configuration is invalid.
@@ -54,6 +58,7 @@ class StreamingTabularDataModel:
         self._header_rows = header_rows
         self._skip_empty_rows = skip_empty_rows
         self._chunk_size = chunk_size
+        self._initial_column_names = column_names
         
         # Initialize state
         self._header_data: list[list[str]] = []
@@ -85,19 +90,25 @@ class StreamingTabularDataModel:
                     header_rows_collected += 1
                 else:
                     # Buffer remaining rows in this chunk (including current), respecting skip_empty_rows
-                    if not (self._skip_empty_rows and all(cell.strip() == "" for cell in row)):
+                    if not (self._skip_empty_rows and all(not cell or cell.isspace() for cell in row)):
                         self._buffer.append(row)
                     
                     # Process remaining rows in the chunk
                     for remaining_row in chunk_iter:
-                        if not (self._skip_empty_rows and all(cell.strip() == "" for cell in remaining_row)):
+                        if not (self._skip_empty_rows and all(not cell or cell.isspace() for cell in remaining_row)):
                             self._buffer.append(remaining_row)
                     break
             if header_rows_collected >= self._header_rows:
                 break
 
         # Process headers
-        if self._header_rows > 0:
+        if self._initial_column_names is not None:
+            # Use the supplied names (copied, since iteration may append to them); header rows
+            # were consumed above but are not merged into names
+            self._header_data = header_data
+            self._column_names = list(self._initial_column_names)
+            self._max_columns = len(self._column_names)
+        elif self._header_rows > 0:
             self._header_data, self._column_names = self.process_headers(
                 header_data,
                 header_rows=self._header_rows
@@ -217,7 +228,7 @@ class StreamingTabularDataModel:
         # Then yield remaining rows from stream, chunk by chunk
         for chunk in self._stream:
             for row in chunk:
-                if self._skip_empty_rows and all(cell.strip() == "" for cell in row):
+                if self._skip_empty_rows and all(not cell or cell.isspace() for cell in row):
                     continue
                 # Create a copy of the row to avoid modifying the original
                 row_copy = row.copy()
@@ -251,9 +262,45 @@ class StreamingTabularDataModel:
         """
         self._buffer.clear()
 
-    def reset_stream(self) -> None:
+    def __enter__(self) -> "StreamingTabularDataModel":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying stream and release buffered rows.
+
+        Streams from DsvHelper.parse_stream are generators that keep the file open
+        until exhausted; closing them releases the file handle without reading the rest.
+        """
+        self._buffer.clear()
+        close = getattr(self._stream, "close", None)
+        if callable(close):
+            close()
+
+    def reset_stream(
+        self,
+        stream: Optional[Iterator[list[list[str]]]] = None
+    ) -> None:
         """
         Reset the stream position (requires a new stream iterator).
+
+        Args:
+            stream (Optional[Iterator[list[list[str]]]]): New stream of data chunks, such as a fresh
+                DsvHelper.parse_stream over the same file. When given, the current stream is closed
+                and the model re-initializes from the new one, so the same instance can be iterated again.
         """
         self._buffer.clear()
-        self._is_initialized = False 
\ No newline at end of file
+        self._is_initialized = False
+        if stream is None:
+            return
+
+        self.close()
+        self._stream = stream
+        self._header_data = []
+        self._column_names = []
+        self._column_index_map = {}
+        self._max_columns = 0
+        self._initialize_from_stream() 
\ No newline at end of file
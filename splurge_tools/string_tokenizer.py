@@ -55,7 +55,7 @@ class StringTokenizer:
         if content is None:
             return []
 
-        if strip and not content.strip():
+        if strip and (not content or content.isspace()):
             return []
 
         result: list[str] = content.split(delimiter)
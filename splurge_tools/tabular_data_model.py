@@ -325,6 +325,6 @@ class TabularDataModel:
             normalized_rows = [
                 row
                 for row in normalized_rows
-                if not all(cell.strip() == "" for cell in row)
+                if not all(not cell or cell.isspace() for cell in row)
             ]
         return normalized_rows
@@ -11,6 +11,8 @@ Key features:
 - File previewing with configurable line limits
 - Complete file loading with header/footer skipping
 - Streaming file loading with configurable chunk sizes
+- Line-by-line iteration over large files
+- Lazy, decode-on-access line views of memory mapped files
 - Configurable whitespace handling and encoding
 
 Copyright (c) 2025 Jim Schilling
@@ -20,9 +22,21 @@ Please preserve this header and all related material when sharing!
 This software is licensed under the MIT License.
 """
 
-from collections import deque
+import io
+import mmap
+import os
+import stat
+import threading
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import accumulate, chain, count, islice
+from operator import add
 from os import PathLike
-from typing import List, Union, Iterator
+from typing import (
+    Any, BinaryIO, Dict, Iterator, List, Literal, Optional, Sequence, TextIO, Tuple, Union, cast, overload
+)
 
 
 class TextFileHelper:
@@ -31,21 +45,816 @@ class TextFileHelper:
     All methods are static and memory efficient.
     """
 
+    # Number of bytes scanned or decoded per slab when reading a file in pieces
+    _SLAB_SIZE: int = 1 << 20
+
+    # File size thresholds used by load: files of at least _LOAD_MMAP_MIN bytes are
+    # memory mapped, files of at least _LOAD_STREAM_MIN bytes are streamed in slabs
+    _LOAD_MMAP_MIN: int = 64 * 1024
+    _LOAD_STREAM_MIN: int = 64 * 1024 * 1024
+
+    # Lines per chunk when load materializes a streamed file
+    _LOAD_STREAM_CHUNK_SIZE: int = 10_000
+
+    # Bytes per worker when line_count scans a large file in parallel byte ranges
+    _COUNT_RANGE_SIZE: int = 16 << 20
+
+    # Opt-in LRU cache of newline offset indexes, keyed by path. Each entry records the
+    # file's modification time and size so that a changed file is indexed again. Both the
+    # total index bytes and the number of entries are bounded
+    _LINE_INDEX_CACHE_MAX_BYTES: int = 128 << 20
+    _LINE_INDEX_CACHE_MAX_ENTRIES: int = 1024
+    _line_index_cache: "OrderedDict[str, Tuple[Tuple[int, int], array]]" = OrderedDict()
+    # Running total of the bytes held by the cached indexes, guarded by the cache lock
+    _line_index_cache_bytes: int = 0
+    _line_index_cache_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def _is_byte_newline_encoding(
+        encoding: str
+    ) -> bool:
+        """
+        Check if an encoding represents the newline character as the single byte b"\\n".
+
+        Args:
+            encoding: Encoding name
+
+        Returns:
+            bool: True if newline bytes can be located without decoding (e.g. utf-8, latin-1)
+        """
+        try:
+            return "\n".encode(encoding) == b"\n"
+
+        except LookupError:
+            return False
+
+    @staticmethod
+    def _split_lines(
+        text: str
+    ) -> List[str]:
+        """
+        Split decoded text into lines without line terminators.
+
+        Only "\\n" is treated as a terminator, matching line iteration over a text
+        stream; str.splitlines() would also split on characters such as "\\x0c",
+        "\\x1c" and "\\u2028".
+
+        Args:
+            text: Decoded text with universal newlines already applied
+
+        Returns:
+            List[str]: Lines without terminators
+        """
+        lines: List[str] = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def _strip_all(lines: List[str]) -> List[str]:
+        """
+        Strip surrounding whitespace from every line.
+
+        map() with the unbound str.strip runs the loop in C, avoiding the
+        per-line bytecode of an equivalent list comprehension. A single regex
+        substitution over the joined text, which strips every line in one call,
+        is several times slower than this.
+
+        Args:
+            lines: Lines to strip
+
+        Returns:
+            List[str]: Stripped lines
+        """
+        return list(map(str.strip, lines))
+
+    @staticmethod
+    def _dedupe_lines(
+        lines: List[str],
+        pool: Dict[str, str]
+    ) -> List[str]:
+        """
+        Replace every line with the first equal string seen in the pool.
+
+        Args:
+            lines: Lines to deduplicate
+            pool: Canonical string for each distinct line; new lines are added
+
+        Returns:
+            List[str]: Lines in which equal strings are the same object
+        """
+        return list(map(pool.setdefault, lines, lines))
+
+    @staticmethod
+    def _trim_lines(
+        lines: List[str],
+        *,
+        strip: bool
+    ) -> List[str]:
+        """
+        Remove line terminators (and optionally surrounding whitespace) from lines read from a text stream.
+
+        The strip decision is made once per list rather than once per line.
+
+        Args:
+            lines: Lines including their "\\n" terminators
+            strip: Whether to strip all surrounding whitespace
+
+        Returns:
+            List[str]: Processed lines
+        """
+        if strip:
+            return TextFileHelper._strip_all(lines)
+
+        return [line.rstrip("\n") for line in lines]
+
+    @staticmethod
+    def _decode_lines(
+        data: Union[bytes, mmap.mmap],
+        *,
+        encoding: str
+    ) -> List[str]:
+        """
+        Decode a block of whole lines and split it into lines without terminators.
+
+        "\\r\\n" and "\\r" are translated to "\\n" first, matching the universal
+        newlines mode of a text stream.
+
+        Args:
+            data: Encoded bytes (or a mapped file) ending on a line boundary
+            encoding: Encoding of data
+
+        Returns:
+            List[str]: Lines without terminators
+
+        Raises:
+            UnicodeDecodeError: If data cannot be decoded with the specified encoding
+        """
+        text: str = str(data, encoding)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return TextFileHelper._split_lines(text)
+
+    @staticmethod
+    def _advise_sequential(
+        fd: int
+    ) -> None:
+        """
+        Tell the kernel that an open file will be read sequentially from start to end.
+
+        The hint enlarges the readahead window and is ignored where unsupported.
+
+        Args:
+            fd: File descriptor of the open file
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        except OSError:
+            # Pipes and some special files do not accept advice
+            pass
+
+    @staticmethod
+    def _map_file(
+        stream: BinaryIO,
+        *,
+        will_need: bool = False
+    ) -> Optional[mmap.mmap]:
+        """
+        Memory map an open binary stream for sequential reading.
+
+        Args:
+            stream: File opened in binary mode
+            will_need: Whether the whole mapping will be read, so the kernel should
+                start reading it in right away (default: False)
+
+        Returns:
+            Optional[mmap.mmap]: Read-only mapping of the whole file, or None if the
+            file is empty, is not a regular file, or cannot be mapped
+        """
+        file_status = os.fstat(stream.fileno())
+
+        # Only regular files report a reliable size and can be memory mapped
+        if not stat.S_ISREG(file_status.st_mode) or file_status.st_size == 0:
+            return None
+
+        try:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except OSError:
+            return None
+
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        if will_need and hasattr(mmap, "MADV_WILLNEED"):
+            mapped.madvise(mmap.MADV_WILLNEED)
+        return mapped
+
+    @staticmethod
+    def _count_line_breaks(
+        data: Union[bytes, bytearray],
+        end: int
+    ) -> int:
+        """
+        Count the line terminators in the first end bytes of data.
+
+        "\n", "\r\n" and a lone "\r" each count once, matching the universal newlines
+        mode of a text stream. A "\r" ending the range counts as lone; callers reading
+        in pieces subtract one when the next piece starts with "\n". Carriage returns
+        are only counted when a quick search finds one.
+
+        Args:
+            data: Bytes read from a file
+            end: Number of leading bytes of data to scan
+
+        Returns:
+            int: Number of line terminators in the range
+        """
+        count = data.count(b"\n", 0, end)
+        if data.find(b"\r", 0, end) >= 0:
+            count += data.count(b"\r", 0, end) - data.count(b"\r\n", 0, end)
+        return count
+
+    @staticmethod
+    def _count_newlines_in_range(
+        fd: int,
+        start: int,
+        end: int
+    ) -> int:
+        """
+        Count the line terminators in a byte range of an open file.
+
+        Args:
+            fd: File descriptor of a regular file
+            start: First byte offset of the range
+            end: Byte offset one past the end of the range
+
+        Returns:
+            int: Number of line terminators in the range, counting a "\r" that ends
+            the range as lone
+        """
+        count = 0
+        ends_with_carriage = False
+        while start < end:
+            data = os.pread(fd, min(TextFileHelper._SLAB_SIZE, end - start), start)
+            if not data:
+                break
+            count += TextFileHelper._count_line_breaks(data, len(data))
+            if ends_with_carriage and data[0] == ord("\n"):
+                count -= 1
+            ends_with_carriage = data[-1] == ord("\r")
+            start += len(data)
+        return count
+
+    @staticmethod
+    def _count_newlines_parallel(
+        fd: int,
+        size: int,
+        workers: int
+    ) -> int:
+        """
+        Count the line terminators of an open file by scanning disjoint byte ranges in parallel.
+
+        os.pread releases the GIL, so the reads of the ranges overlap and keep
+        several requests in flight on the storage device.
+
+        Args:
+            fd: File descriptor of a regular file
+            size: File size in bytes
+            workers: Number of byte ranges and worker threads
+
+        Returns:
+            int: Number of line terminators in the file
+        """
+        step = -(-size // workers)
+        starts = range(0, size, step)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = executor.map(
+                lambda start: TextFileHelper._count_newlines_in_range(fd, start, min(start + step, size)),
+                starts
+            )
+            count = sum(counts)
+
+        # A "\r\n" split between two ranges was counted once in each
+        return count - sum(os.pread(fd, 2, start - 1) == b"\r\n" for start in starts[1:])
+
+    @staticmethod
+    def _find_line_offset(
+        mapped: mmap.mmap,
+        start: int,
+        end: int,
+        line_count: int
+    ) -> int:
+        """
+        Find the offset just past the given number of terminated lines.
+
+        "\n", "\r\n" and a lone "\r" each terminate a line, matching the universal
+        newlines mode of a text stream. The search for "\r" is bounded by the next
+        "\n", so files without carriage returns are scanned only once.
+
+        Args:
+            mapped: Mapped file
+            start: Offset of the first line
+            end: Offset one past the last byte to search (a line boundary)
+            line_count: Number of lines to pass over
+
+        Returns:
+            int: Offset of the line following the skipped lines, or -1 if fewer than
+            line_count terminated lines exist in the range
+        """
+        pos = start
+        for _ in range(line_count):
+            newline = mapped.find(b"\n", pos, end)
+            carriage = mapped.find(b"\r", pos, end if newline < 0 else newline)
+            if carriage >= 0:
+                pos = newline + 1 if carriage + 1 == newline else carriage + 1
+            elif newline >= 0:
+                pos = newline + 1
+            else:
+                return -1
+        return pos
+
+    @staticmethod
+    def _rfind_line_break(
+        mapped: mmap.mmap,
+        start: int,
+        end: int
+    ) -> int:
+        """
+        Find the last line terminator ("\n", "\r\n" or a lone "\r") in a byte range.
+
+        Args:
+            mapped: Mapped file
+            start: Offset of the first byte to search
+            end: Offset one past the last byte to search; must not split a "\r\n"
+
+        Returns:
+            int: Offset of the first byte of the terminator, or -1 if the range has none
+        """
+        newline = mapped.rfind(b"\n", start, end)
+        carriage = mapped.rfind(b"\r", max(start, newline + 1), end)
+        if carriage >= 0:
+            return carriage
+        if newline > start and mapped[newline - 1] == ord("\r"):
+            return newline - 1
+        return newline
+
+    @staticmethod
+    def _line_break_end(
+        mapped: mmap.mmap,
+        offset: int
+    ) -> int:
+        """
+        Get the offset just past the line terminator that starts at offset.
+
+        Args:
+            mapped: Mapped file
+            offset: Offset of the first byte of a terminator
+
+        Returns:
+            int: Offset of the following line
+        """
+        return offset + 2 if mapped[offset:offset + 2] == b"\r\n" else offset + 1
+
+    @staticmethod
+    def _newline_offsets(
+        mapped: mmap.mmap
+    ) -> array:
+        """
+        Build an index of the offsets of the last byte of every line terminator in a mapped file.
+
+        "\\n", "\\r\\n" and a lone "\\r" each end a line, matching the universal newlines
+        mode of a text stream, so each line starts one byte past the previous offset.
+        Each slab is split on b"\\n" and the offsets are the running sum of the
+        piece lengths plus one byte per preceding newline, so the whole index is
+        built by C-level iterators without a Python step per line.
+
+        Args:
+            mapped: Mapped file
+
+        Returns:
+            array: Offsets of the terminator bytes, as signed 64-bit integers
+        """
+        offsets = array("q")
+        size = len(mapped)
+        pos = 0
+        while pos < size:
+            slab = mapped[pos:pos + TextFileHelper._SLAB_SIZE]
+            if b"\r" in slab:
+                # Keep a "\r\n" split between slabs together, then mark the last byte of each
+                # "\r\n" and lone "\r" with b"\n"; the replacements keep every offset in place
+                if slab.endswith(b"\r") and mapped[pos + len(slab):pos + len(slab) + 1] == b"\n":
+                    slab += b"\n"
+                slab = slab.replace(b"\r\n", b"\0\n").replace(b"\r", b"\n")
+            # The piece after the last newline of a slab has no newline of its own
+            pieces = slab.split(b"\n")
+            pieces.pop()
+            offsets.extend(map(add, accumulate(map(len, pieces)), count(pos)))
+            pos += len(slab)
+        return offsets
+
+    @staticmethod
+    def _get_line_index(
+        file_name: Union[PathLike, str]
+    ) -> Optional[Tuple[array, int]]:
+        """
+        Get the newline offset index of a file from the cache, building it on a miss.
+
+        Args:
+            file_name: Path to a text file in a single-byte-newline encoding
+
+        Returns:
+            Optional[Tuple[array, int]]: Newline offsets and file size, or None if the
+            file is not a regular file or cannot be mapped
+        """
+        path = os.fspath(file_name)
+        with open(path, "rb") as stream:
+            file_status = os.fstat(stream.fileno())
+            if not stat.S_ISREG(file_status.st_mode):
+                return None
+
+            stamp = (file_status.st_mtime_ns, file_status.st_size)
+            with TextFileHelper._line_index_cache_lock:
+                entry = TextFileHelper._line_index_cache.get(path)
+                if entry is not None and entry[0] == stamp:
+                    TextFileHelper._line_index_cache.move_to_end(path)
+                    return entry[1], file_status.st_size
+
+            if file_status.st_size == 0:
+                offsets = array("q")
+            else:
+                mapped = TextFileHelper._map_file(stream)
+                if mapped is None:
+                    return None
+                with mapped:
+                    offsets = TextFileHelper._newline_offsets(mapped)
+
+        # Store the index and evict the least recently used entries beyond the budgets
+        with TextFileHelper._line_index_cache_lock:
+            cache = TextFileHelper._line_index_cache
+            cached_bytes = TextFileHelper._line_index_cache_bytes
+            replaced = cache.pop(path, None)
+            if replaced is not None:
+                cached_bytes -= len(replaced[1]) * replaced[1].itemsize
+            cache[path] = (stamp, offsets)
+            cached_bytes += len(offsets) * offsets.itemsize
+            while cache and (
+                cached_bytes > TextFileHelper._LINE_INDEX_CACHE_MAX_BYTES
+                or len(cache) > TextFileHelper._LINE_INDEX_CACHE_MAX_ENTRIES
+            ):
+                _, (_, evicted) = cache.popitem(last=False)
+                cached_bytes -= len(evicted) * evicted.itemsize
+            TextFileHelper._line_index_cache_bytes = cached_bytes
+
+        return offsets, file_status.st_size
+
+    @staticmethod
+    def _indexed_line_count(
+        offsets: array,
+        size: int
+    ) -> int:
+        """
+        Count the lines of a file from its newline offset index.
+
+        Args:
+            offsets: Newline offsets of the file
+            size: File size in bytes
+
+        Returns:
+            int: Number of lines in the file
+        """
+        if size == 0:
+            return 0
+        return len(offsets) if offsets and offsets[-1] == size - 1 else len(offsets) + 1
+
+    @staticmethod
+    def _preview_indexed(
+        file_name: Union[PathLike, str],
+        offsets: array,
+        size: int,
+        *,
+        max_lines: int,
+        strip: bool,
+        encoding: str,
+        skip_header_rows: int
+    ) -> List[str]:
+        """
+        Read the first lines of a file, locating them with its newline offset index.
+
+        Only the bytes of the returned lines are read and decoded.
+
+        Args:
+            file_name: Path to the text file
+            offsets: Newline offsets of the file
+            size: File size in bytes
+            max_lines: Maximum number of lines to return
+            strip: Whether to strip whitespace from lines
+            encoding: File encoding
+            skip_header_rows: Number of rows to skip from the start
+
+        Returns:
+            List[str]: Lines of the file following the skipped header rows
+        """
+        if skip_header_rows >= TextFileHelper._indexed_line_count(offsets, size):
+            return []
+
+        start = offsets[skip_header_rows - 1] + 1 if skip_header_rows > 0 else 0
+        last = skip_header_rows + max_lines - 1
+        end = offsets[last] + 1 if last < len(offsets) else size
+        with open(file_name, "rb") as stream:
+            stream.seek(start)
+            data = stream.read(end - start)
+
+        lines: List[str] = TextFileHelper._decode_lines(data, encoding=encoding)
+        del lines[max_lines:]
+        if strip:
+            return TextFileHelper._strip_all(lines)
+
+        return lines
+
+    @staticmethod
+    def _preview_mapped(
+        mapped: mmap.mmap,
+        *,
+        max_lines: int,
+        strip: bool,
+        encoding: str,
+        skip_header_rows: int
+    ) -> List[str]:
+        """
+        Read the first lines of a mapped file, decoding only the bytes that are returned.
+
+        Args:
+            mapped: Mapped file
+            max_lines: Maximum number of lines to return
+            strip: Whether to strip whitespace from lines
+            encoding: File encoding
+            skip_header_rows: Number of rows to skip from the start
+
+        Returns:
+            List[str]: Lines after the header rows
+        """
+        size = len(mapped)
+        pos = TextFileHelper._find_line_offset(mapped, 0, size, skip_header_rows)
+        if pos < 0:
+            return []
+
+        end = TextFileHelper._find_line_offset(mapped, pos, size, max_lines)
+        if end < 0:
+            end = size
+
+        lines: List[str] = TextFileHelper._decode_lines(mapped[pos:end], encoding=encoding)
+        del lines[max_lines:]
+        if strip:
+            return TextFileHelper._strip_all(lines)
+
+        return lines
+
+    @staticmethod
+    def _iter_mapped_slabs(
+        mapped: mmap.mmap,
+        start: int,
+        end: int,
+        *,
+        encoding: str
+    ) -> Iterator[List[str]]:
+        """
+        Decode a byte range of a mapped file in slabs that end on line boundaries.
+
+        Args:
+            mapped: Mapped file
+            start: Offset of the first byte (start of a line)
+            end: Offset one past the last byte (end of a line or end of file)
+            encoding: File encoding
+
+        Yields:
+            List[str]: Lines of each slab without terminators
+        """
+        pos = start
+        while pos < end:
+            slab_end = min(pos + TextFileHelper._SLAB_SIZE, end)
+            if slab_end < end:
+                # A "\r" ending the slab is kept with a "\n" that follows it
+                line_break = TextFileHelper._rfind_line_break(mapped, pos, slab_end)
+                if line_break >= 0:
+                    slab_end = TextFileHelper._line_break_end(mapped, line_break)
+                else:
+                    # A single line is longer than the slab; extend the slab to its terminator
+                    slab_end = TextFileHelper._find_line_offset(mapped, slab_end, end, 1)
+                    if slab_end < 0:
+                        slab_end = end
+
+            yield TextFileHelper._decode_lines(mapped[pos:slab_end], encoding=encoding)
+            pos = slab_end
+
+    @staticmethod
+    def _iter_mapped_blocks(
+        mapped: mmap.mmap,
+        *,
+        strip: bool,
+        encoding: str,
+        skip_header_rows: int,
+        skip_footer_rows: int
+    ) -> Iterator[List[str]]:
+        """
+        Yield blocks of lines from a mapped file, one block per decoded slab.
+
+        Header and footer rows are located with terminator searches on the raw bytes,
+        so skipped rows are never decoded and no footer window has to be buffered.
+
+        Args:
+            mapped: Mapped file
+            strip: Whether to strip whitespace from lines
+            encoding: File encoding
+            skip_header_rows: Number of rows to skip from the start
+            skip_footer_rows: Number of rows to skip from the end
+
+        Yields:
+            List[str]: Blocks of lines from the file
+        """
+        size = len(mapped)
+
+        # Walk back over the footer rows; a trailing terminator ends the last line
+        end = size
+        if skip_footer_rows > 0:
+            search_end = size
+            if mapped[size - 1] in b"\r\n":
+                search_end = TextFileHelper._rfind_line_break(mapped, 0, size)
+            for _ in range(skip_footer_rows):
+                search_end = TextFileHelper._rfind_line_break(mapped, 0, search_end)
+                if search_end < 0:
+                    return
+            end = TextFileHelper._line_break_end(mapped, search_end)
+
+        # Walk forward over the header rows
+        pos = TextFileHelper._find_line_offset(mapped, 0, end, skip_header_rows)
+        if pos < 0:
+            return
+
+        for lines in TextFileHelper._iter_mapped_slabs(mapped, pos, end, encoding=encoding):
+            yield TextFileHelper._strip_all(lines) if strip else lines
+
+    @staticmethod
+    def _skip_text_lines(
+        stream: TextIO,
+        line_count: int
+    ) -> Optional[List[str]]:
+        """
+        Skip lines at the start of a text stream by counting newlines in decoded slabs.
+
+        No string is created per skipped line; only the slab holding the last
+        skipped line is split.
+
+        Args:
+            stream: File opened in text mode
+            line_count: Number of lines to skip
+
+        Returns:
+            Optional[List[str]]: Whole lines, including terminators, that were read past
+            the skipped lines, or None if the stream ended before line_count lines
+        """
+        remaining = line_count
+        while remaining > 0:
+            slab = stream.read(TextFileHelper._SLAB_SIZE)
+            if not slab:
+                return None
+
+            newlines = slab.count("\n")
+            if newlines < remaining:
+                remaining -= newlines
+                continue
+
+            # Complete the partial line at the end of the slab and split what is left
+            rest = slab.split("\n", remaining)[-1]
+            if rest and not rest.endswith("\n"):
+                rest += stream.readline()
+            return io.StringIO(rest, newline="\n").readlines()
+
+        return []
+
+    @staticmethod
+    def _iter_text_blocks(
+        stream: TextIO,
+        *,
+        strip: bool,
+        skip_header_rows: int,
+        skip_footer_rows: int
+    ) -> Iterator[List[str]]:
+        """
+        Yield the lines of a text stream in blocks of roughly _SLAB_SIZE characters.
+
+        The last skip_footer_rows lines are held back between blocks.
+
+        Args:
+            stream: Stream opened in text mode
+            strip: Whether to strip whitespace from lines
+            skip_header_rows: Number of rows to skip from the start
+            skip_footer_rows: Number of rows to skip from the end
+
+        Yields:
+            List[str]: Non-empty blocks of lines from the stream
+        """
+        head = TextFileHelper._skip_text_lines(stream, skip_header_rows)
+        if head is None:
+            return
+
+        # Read whole lines a slab at a time and hold back the last skip_footer_rows lines,
+        # so the footer window costs list operations per block rather than per line
+        pending: List[str] = []
+        for block in chain([head], iter(partial(stream.readlines, TextFileHelper._SLAB_SIZE), [])):
+            pending.extend(TextFileHelper._trim_lines(block, strip=strip))
+            ready = len(pending) - skip_footer_rows
+            if ready > 0:
+                yield pending[:ready]
+                del pending[:ready]
+
+    @staticmethod
+    def _iter_line_blocks(
+        file_name: Union[PathLike, str, TextIO],
+        *,
+        strip: bool,
+        encoding: str,
+        skip_header_rows: int,
+        skip_footer_rows: int
+    ) -> Iterator[List[str]]:
+        """
+        Yield the lines of a file in blocks of roughly _SLAB_SIZE bytes or characters.
+
+        Files in single-byte-newline encodings are memory mapped and decoded in
+        line-aligned slabs. Other encodings, and open text streams, are read as a
+        text stream, holding back the last skip_footer_rows lines between blocks.
+        An open text stream is read from its current position and left open.
+
+        Args:
+            file_name: Path to the text file, or an open text stream
+            strip: Whether to strip whitespace from lines
+            encoding: File encoding (ignored for open text streams)
+            skip_header_rows: Number of rows to skip from the start
+            skip_footer_rows: Number of rows to skip from the end
+
+        Yields:
+            List[str]: Non-empty blocks of lines from the file
+        """
+        if hasattr(file_name, "read"):
+            yield from TextFileHelper._iter_text_blocks(
+                cast(TextIO, file_name),
+                strip=strip,
+                skip_header_rows=skip_header_rows,
+                skip_footer_rows=skip_footer_rows
+            )
+            return
+
+        if TextFileHelper._is_byte_newline_encoding(encoding):
+            with open(file_name, "rb") as raw_stream:
+                mapped = TextFileHelper._map_file(raw_stream)
+                if mapped is not None:
+                    with mapped:
+                        yield from TextFileHelper._iter_mapped_blocks(
+                            mapped,
+                            strip=strip,
+                            encoding=encoding,
+                            skip_header_rows=skip_header_rows,
+                            skip_footer_rows=skip_footer_rows
+                        )
+                    return
+
+        with open(file_name, "r", encoding=encoding) as stream:
+            TextFileHelper._advise_sequential(stream.fileno())
+            yield from TextFileHelper._iter_text_blocks(
+                stream,
+                strip=strip,
+                skip_header_rows=skip_header_rows,
+                skip_footer_rows=skip_footer_rows
+            )
+
     @staticmethod
     def line_count(
         file_name: Union[PathLike, str],
         *,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        cache_index: bool = False
     ) -> int:
         """
         Count the number of lines in a text file.
 
-        This method efficiently counts lines by iterating through the file
-        without loading it entirely into memory.
+        For encodings that represent the newline as the single byte b"\\n"
+        (utf-8, ascii, latin-1, ...), line terminators ("\\n", "\\r\\n" or a lone
+        "\\r") are counted directly without decoding, using unbuffered 1 MiB reads
+        into a reusable buffer. Large files
+        on multi-core machines are split into byte ranges that are counted by a
+        pool of threads. Other encodings (e.g. utf-16) are decoded in large slabs
+        in which "\\n" is counted.
+
+        With cache_index, the newline offsets of the file are indexed and cached,
+        so later line_count and preview calls on the unchanged file skip the scan.
 
         Args:
             file_name: Path to the text file
             encoding: File encoding to use (default: 'utf-8')
+            cache_index: Whether to use the cached newline index of the file (default: False)
 
         Returns:
             int: Number of lines in the file
@@ -55,8 +864,56 @@ class TextFileHelper:
             IOError: If there are issues reading the file
             UnicodeDecodeError: If the file cannot be decoded with the specified encoding
         """
+        if TextFileHelper._is_byte_newline_encoding(encoding):
+            if cache_index:
+                index = TextFileHelper._get_line_index(file_name)
+                if index is not None:
+                    return TextFileHelper._indexed_line_count(*index)
+
+            # Unbuffered raw reads into one reusable buffer skip the io buffering layer,
+            # and bytearray.count() scans each slab with memchr
+            with open(file_name, "rb", buffering=0) as stream:
+                TextFileHelper._advise_sequential(stream.fileno())
+
+                # Large regular files are split into byte ranges counted by a pool of threads
+                file_status = os.fstat(stream.fileno())
+                workers = min(os.cpu_count() or 1, file_status.st_size // TextFileHelper._COUNT_RANGE_SIZE)
+                if workers > 1 and stat.S_ISREG(file_status.st_mode) and hasattr(os, "pread"):
+                    size = file_status.st_size
+                    count = TextFileHelper._count_newlines_parallel(stream.fileno(), size, workers)
+                    return count if os.pread(stream.fileno(), 1, size - 1) in (b"\n", b"\r") else count + 1
+
+                buffer = bytearray(TextFileHelper._SLAB_SIZE)
+                count = 0
+                last_size = 0
+                ends_with_carriage = False
+                while True:
+                    size = stream.readinto(buffer)
+                    if not size:
+                        break
+                    count += TextFileHelper._count_line_breaks(buffer, size)
+                    # A "\r\n" split between two reads was counted once in each
+                    if ends_with_carriage and buffer[0] == ord("\n"):
+                        count -= 1
+                    ends_with_carriage = buffer[size - 1] == ord("\r")
+                    last_size = size
+
+                if last_size == 0:
+                    return 0
+                return count if buffer[last_size - 1] in b"\r\n" else count + 1
+
+        # Count "\n" in large decoded slabs rather than creating a string per line
         with open(file_name, "r", encoding=encoding) as stream:
-            return sum(1 for _ in stream)
+            TextFileHelper._advise_sequential(stream.fileno())
+            count = 0
+            last_slab = ""
+            for slab in iter(partial(stream.read, TextFileHelper._SLAB_SIZE), ""):
+                count += slab.count("\n")
+                last_slab = slab
+
+            if not last_slab:
+                return 0
+            return count if last_slab.endswith("\n") else count + 1
 
     @staticmethod
     def preview(
@@ -65,13 +922,17 @@ class TextFileHelper:
         max_lines: int = 100,
         strip: bool = True,
         encoding: str = "utf-8",
-        skip_header_rows: int = 0
+        skip_header_rows: int = 0,
+        cache_index: bool = False
     ) -> List[str]:
         """
         Preview the first N lines of a text file.
 
         This method reads up to max_lines from the beginning of the file,
         optionally stripping whitespace from each line and skipping header rows.
+        Files in single-byte-newline encodings are memory mapped, and only the
+        bytes of the returned lines are decoded. With cache_index, the lines are
+        located with the cached newline index of the file (see line_count).
 
         Args:
             file_name: Path to the text file
@@ -79,6 +940,7 @@ class TextFileHelper:
             strip: Whether to strip whitespace from lines (default: True)
             encoding: File encoding to use (default: 'utf-8')
             skip_header_rows: Number of rows to skip from the start (default: 0)
+            cache_index: Whether to use the cached newline index of the file (default: False)
 
         Returns:
             List[str]: List of lines from the file
@@ -93,26 +955,53 @@ class TextFileHelper:
             raise ValueError("TextFileHelper.preview: max_lines is less than 1")
         
         skip_header_rows = max(0, skip_header_rows)
-        lines: List[str] = []
-        
+
+        if TextFileHelper._is_byte_newline_encoding(encoding):
+            if cache_index:
+                index = TextFileHelper._get_line_index(file_name)
+                if index is not None:
+                    return TextFileHelper._preview_indexed(
+                        file_name,
+                        *index,
+                        max_lines=max_lines,
+                        strip=strip,
+                        encoding=encoding,
+                        skip_header_rows=skip_header_rows
+                    )
+
+            with open(file_name, "rb") as raw_stream:
+                mapped = TextFileHelper._map_file(raw_stream)
+                if mapped is not None:
+                    with mapped:
+                        return TextFileHelper._preview_mapped(
+                            mapped,
+                            max_lines=max_lines,
+                            strip=strip,
+                            encoding=encoding,
+                            skip_header_rows=skip_header_rows
+                        )
+
         with open(file_name, "r", encoding=encoding) as stream:
-            # Skip header rows
-            for _ in range(skip_header_rows):
-                if not stream.readline():
-                    return lines
-            
+            # Skip header rows; a zero-length deque consumes them without a Python-level loop
+            deque(islice(stream, skip_header_rows), maxlen=0)
+
             # Read up to max_lines after skipping headers
-            for _ in range(max_lines):
-                line = stream.readline()
-                if not line:
-                    break
-                lines.append(line.strip() if strip else line.rstrip("\n"))
-        
-        return lines
+            lines: List[str] = list(islice(stream, max_lines))
+
+        return TextFileHelper._trim_lines(lines, strip=strip)
+
+    @staticmethod
+    def clear_line_index_cache() -> None:
+        """
+        Discard all cached newline indexes built by line_count and preview.
+        """
+        with TextFileHelper._line_index_cache_lock:
+            TextFileHelper._line_index_cache.clear()
+            TextFileHelper._line_index_cache_bytes = 0
 
     @staticmethod
     def load_as_stream(
-        file_name: Union[PathLike, str],
+        file_name: Union[PathLike, str, TextIO],
         *,
         strip: bool = True,
         encoding: str = "utf-8",
@@ -125,11 +1014,15 @@ class TextFileHelper:
 
         This method yields chunks of lines from the file, allowing for
         memory-efficient processing of large files. Each chunk contains
-        up to chunk_size lines. Uses a sliding window approach to handle
-        footer row skipping without loading the entire file into memory.
+        up to chunk_size lines. Files in single-byte-newline encodings are
+        memory mapped and decoded in large slabs that end on line boundaries;
+        header and footer rows are located on the raw bytes. Other encodings
+        are read as a text stream a slab at a time, holding back the footer rows.
+        An open text stream (e.g. io.StringIO) is read the same way from its
+        current position, and is left open for the caller to close.
 
         Args:
-            file_name: Path to the text file
+            file_name: Path to the text file, or an open text stream
             strip: Whether to strip whitespace from lines (default: True)
             encoding: File encoding to use (default: 'utf-8')
             skip_header_rows: Number of rows to skip from the start (default: 0)
@@ -151,71 +1044,127 @@ class TextFileHelper:
         skip_header_rows = max(0, skip_header_rows)
         skip_footer_rows = max(0, skip_footer_rows)
         
-        with open(file_name, "r", encoding=encoding) as stream:
-            # Skip header rows
-            for _ in range(skip_header_rows):
-                if not stream.readline():
-                    return
-            
-            # Use a sliding window to handle footer skipping efficiently
-            if skip_footer_rows > 0:
-                # Buffer to hold the last skip_footer_rows lines
-                buffer: deque[str] = deque(maxlen=skip_footer_rows)
-                current_chunk: List[str] = []
-                
-                for line in stream:
-                    processed_line = line.strip() if strip else line.rstrip("\n")
-                    
-                    # Add to buffer for potential footer skipping
-                    buffer.append(processed_line)
-                    
-                    # If buffer is full, move oldest line to current chunk
-                    if len(buffer) == skip_footer_rows:
-                        current_chunk.append(buffer.popleft())
-                        
-                        # Yield chunk when it reaches the desired size
-                        if len(current_chunk) >= chunk_size:
-                            yield current_chunk
-                            current_chunk = []
-                
-                # Handle remaining lines (excluding the last skip_footer_rows)
-                # The buffer now contains exactly the footer rows to skip
-                # All other lines have already been processed and yielded
-                
-                # Yield any remaining lines in the final chunk
-                if current_chunk:
-                    yield current_chunk
-            else:
-                # No footer skipping needed - simple streaming
-                current_chunk: List[str] = []
-                
-                for line in stream:
-                    processed_line = line.strip() if strip else line.rstrip("\n")
-                    current_chunk.append(processed_line)
-                    
-                    # Yield chunk when it reaches the desired size
-                    if len(current_chunk) >= chunk_size:
-                        yield current_chunk
-                        current_chunk = []
-                
-                # Yield any remaining lines in the final chunk
-                if current_chunk:
-                    yield current_chunk
+        # Regroup the line blocks into chunks of exactly chunk_size lines. Whole chunks are
+        # sliced straight out of each block; only the remainder is carried to the next block
+        pending: List[str] = []
+        for lines in TextFileHelper._iter_line_blocks(
+            file_name,
+            strip=strip,
+            encoding=encoding,
+            skip_header_rows=skip_header_rows,
+            skip_footer_rows=skip_footer_rows
+        ):
+            start = 0
+            if pending:
+                start = chunk_size - len(pending)
+                pending.extend(lines[:start])
+                if len(pending) < chunk_size:
+                    continue
+                yield pending
+
+            end = len(lines) - (len(lines) - start) % chunk_size
+            for index in range(start, end, chunk_size):
+                yield lines[index:index + chunk_size]
+            pending = lines[end:]
+
+        if pending:
+            yield pending
 
     @staticmethod
-    def load(
+    def iter_lines(
         file_name: Union[PathLike, str],
         *,
         strip: bool = True,
         encoding: str = "utf-8",
         skip_header_rows: int = 0,
         skip_footer_rows: int = 0
-    ) -> List[str]:
+    ) -> Iterator[str]:
+        """
+        Iterate over the lines of a text file one at a time.
+
+        Lines are decoded in large blocks, like load_as_stream, but are yielded
+        individually without being regrouped into chunk lists. Use this when the
+        caller only iterates over the lines once.
+
+        Args:
+            file_name: Path to the text file
+            strip: Whether to strip whitespace from lines (default: True)
+            encoding: File encoding to use (default: 'utf-8')
+            skip_header_rows: Number of rows to skip from the start (default: 0)
+            skip_footer_rows: Number of rows to skip from the end (default: 0)
+
+        Yields:
+            str: Lines from the file, excluding skipped rows
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            IOError: If there are issues reading the file
+            UnicodeDecodeError: If the file cannot be decoded with the specified encoding
+        """
+        for lines in TextFileHelper._iter_line_blocks(
+            file_name,
+            strip=strip,
+            encoding=encoding,
+            skip_header_rows=max(0, skip_header_rows),
+            skip_footer_rows=max(0, skip_footer_rows)
+        ):
+            yield from lines
+
+    @overload
+    @staticmethod
+    def load(
+        file_name: Union[PathLike, str],
+        *,
+        strip: bool = True,
+        encoding: str = "utf-8",
+        skip_header_rows: int = 0,
+        skip_footer_rows: int = 0,
+        lazy: Literal[False] = False,
+        dedupe: bool = False
+    ) -> List[str]: ...
+
+    @overload
+    @staticmethod
+    def load(
+        file_name: Union[PathLike, str],
+        *,
+        strip: bool = True,
+        encoding: str = "utf-8",
+        skip_header_rows: int = 0,
+        skip_footer_rows: int = 0,
+        lazy: bool,
+        dedupe: bool = False
+    ) -> Union[List[str], "LineView"]: ...
+
+    @staticmethod
+    def load(
+        file_name: Union[PathLike, str],
+        *,
+        strip: bool = True,
+        encoding: str = "utf-8",
+        skip_header_rows: int = 0,
+        skip_footer_rows: int = 0,
+        lazy: bool = False,
+        dedupe: bool = False
+    ) -> Union[List[str], "LineView"]:
         """
         Load the entire contents of a text file into a list of strings.
 
         This method reads the complete file into memory, with options to
-        strip whitespace from each line and skip header/footer rows.
+        strip whitespace from each line and skip header/footer rows. The read
+        strategy depends on the file size: small files are read in one call,
+        medium files are memory mapped and decoded in place, and very large
+        files are streamed in slabs via load_as_stream. Every strategy ends lines
+        at "\\n", "\\r\\n" or a lone "\\r", as a text-mode read does, so the result
+        does not depend on the file size.
+
+        With lazy=True, files in single-byte-newline encodings are instead memory
+        mapped and returned as a LineView, which decodes lines only when they are
+        accessed. Other files are still loaded into a list.
+
+        With dedupe=True, equal lines share a single string object. This costs a
+        hash lookup per line and pays off for files with many repeated lines, such
+        as logs or data with categorical columns.
 
         Args:
             file_name: Path to the text file
@@ -223,9 +1172,12 @@ class TextFileHelper:
             encoding: File encoding to use (default: 'utf-8')
             skip_header_rows: Number of rows to skip from the start (default: 0)
             skip_footer_rows: Number of rows to skip from the end (default: 0)
+            lazy: Whether to return a LineView over the mapped file (default: False)
+            dedupe: Whether equal lines should share one string object; ignored for
+                lazy loads (default: False)
 
         Returns:
-            List[str]: List of all lines from the file, excluding skipped rows
+            Union[List[str], LineView]: All lines from the file, excluding skipped rows
 
         Raises:
             FileNotFoundError: If the specified file doesn't exist
@@ -234,13 +1186,183 @@ class TextFileHelper:
         """
         skip_header_rows = max(0, skip_header_rows)
         skip_footer_rows = max(0, skip_footer_rows)
-        with open(file_name, "r", encoding=encoding) as stream:
-            for _ in range(skip_header_rows):
-                if not stream.readline():
-                    return []
-            lines: List[str] = [line.strip() if strip else line.rstrip("\n") for line in stream]
-            if skip_footer_rows > 0:
-                if skip_footer_rows >= len(lines):
-                    return []
-                lines = lines[:-skip_footer_rows]
+        file_size = os.path.getsize(file_name)
+
+        if lazy and TextFileHelper._is_byte_newline_encoding(encoding):
+            with open(file_name, "rb") as stream:
+                mapped = TextFileHelper._map_file(stream)
+            if mapped is not None:
+                offsets = TextFileHelper._newline_offsets(mapped)
+                total = TextFileHelper._indexed_line_count(offsets, len(mapped))
+                if skip_header_rows + skip_footer_rows < total:
+                    return LineView(
+                        mapped,
+                        offsets,
+                        skip_header_rows,
+                        total - skip_footer_rows,
+                        strip=strip,
+                        encoding=encoding
+                    )
+                mapped.close()
+
+        # Very large files are streamed in slabs so the whole encoded file and its decoded
+        # text are never held in memory alongside the resulting list
+        pool: Dict[str, str] = {}
+        if file_size >= TextFileHelper._LOAD_STREAM_MIN:
+            lines: List[str] = []
+            for chunk in TextFileHelper.load_as_stream(
+                file_name,
+                strip=strip,
+                encoding=encoding,
+                skip_header_rows=skip_header_rows,
+                skip_footer_rows=skip_footer_rows,
+                chunk_size=TextFileHelper._LOAD_STREAM_CHUNK_SIZE
+            ):
+                lines.extend(TextFileHelper._dedupe_lines(chunk, pool) if dedupe else chunk)
             return lines
+
+        # Mapping only pays off when the whole file is read and its setup cost is amortized;
+        # smaller files are read into a bytes object in a single call instead
+        with open(file_name, "rb") as stream:
+            TextFileHelper._advise_sequential(stream.fileno())
+            mapped = None
+            if file_size >= TextFileHelper._LOAD_MMAP_MIN:
+                mapped = TextFileHelper._map_file(stream, will_need=True)
+            if mapped is None:
+                lines = TextFileHelper._decode_lines(stream.read(), encoding=encoding)
+            else:
+                with mapped:
+                    lines = TextFileHelper._decode_lines(mapped, encoding=encoding)
+
+        if skip_header_rows + skip_footer_rows >= len(lines):
+            return []
+
+        # Trim in place; the split already produced an exactly sized list
+        if skip_header_rows > 0:
+            del lines[:skip_header_rows]
+
+        if skip_footer_rows > 0:
+            del lines[-skip_footer_rows:]
+
+        if strip:
+            lines = TextFileHelper._strip_all(lines)
+
+        if dedupe:
+            return TextFileHelper._dedupe_lines(lines, pool)
+
+        return lines
+
+
+class LineView(Sequence[str]):
+    """
+    Read-only sequence of the lines of a memory mapped text file.
+
+    Lines are located with a newline offset index and decoded only when they
+    are accessed, so a view costs eight bytes per line until it is read.
+    Iteration decodes the lines in large batches. Lines end at "\\n", "\\r\\n"
+    or a lone "\\r", as in TextFileHelper.load.
+
+    Views are returned by TextFileHelper.load(..., lazy=True). Close the view,
+    or use it as a context manager, to release the mapping.
+    """
+
+    # Number of lines decoded per batch while iterating
+    _BATCH_SIZE: int = 10_000
+
+    __slots__ = ("_mapped", "_offsets", "_first", "_stop", "_strip", "_encoding")
+
+    def __init__(
+        self,
+        mapped: mmap.mmap,
+        offsets: array,
+        first: int,
+        stop: int,
+        *,
+        strip: bool = True,
+        encoding: str = "utf-8"
+    ) -> None:
+        """
+        Initialize LineView.
+
+        Args:
+            mapped: Mapped file; the view takes ownership of the mapping
+            offsets: Newline offsets of the mapped file
+            first: Index of the first line of the file in the view
+            stop: Index one past the last line of the file in the view
+            strip: Whether to strip whitespace from lines (default: True)
+            encoding: File encoding (default: 'utf-8')
+        """
+        self._mapped = mapped
+        self._offsets = offsets
+        self._first = first
+        self._stop = stop
+        self._strip = strip
+        self._encoding = encoding
+
+    def __len__(self) -> int:
+        return self._stop - self._first
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._decode_range(self._first + start, self._first + max(start, stop))
+            return [self[position] for position in range(start, stop, step)]
+
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("LineView index out of range")
+        return self._decode_range(self._first + position, self._first + position + 1)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        for first in range(self._first, self._stop, LineView._BATCH_SIZE):
+            yield from self._decode_range(first, min(first + LineView._BATCH_SIZE, self._stop))
+
+    def __enter__(self) -> "LineView":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the mapping of the file. The view cannot be read afterwards.
+        """
+        self._mapped.close()
+
+    def _decode_range(
+        self,
+        first: int,
+        stop: int
+    ) -> List[str]:
+        """
+        Decode a contiguous range of lines of the file in one call.
+
+        Args:
+            first: Index of the first line of the file to decode
+            stop: Index one past the last line of the file to decode
+
+        Returns:
+            List[str]: Decoded lines
+        """
+        if first >= stop:
+            return []
+
+        start = self._offsets[first - 1] + 1 if first > 0 else 0
+        terminated = stop - 1 < len(self._offsets)
+        end = self._offsets[stop - 1] + 1 if terminated else len(self._mapped)
+
+        lines = TextFileHelper._decode_lines(self._mapped[start:end], encoding=self._encoding)
+        if self._strip:
+            return TextFileHelper._strip_all(lines)
+
+        return lines
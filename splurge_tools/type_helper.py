@@ -16,12 +16,192 @@ This software is licensed under the MIT License.
 """
 
 import collections.abc
+import math
+import random
 import re
 import typing
+from collections import Counter
 from datetime import date, datetime, time
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Iterable, Union
 
+# strptime formats tried, in order, when validating and converting dates
+_DATE_PATTERNS: tuple[str, ...] = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y.%m.%d",
+    "%Y%m%d",
+    "%Y-%d-%m",
+    "%Y/%d/%m",
+    "%Y.%d.%m",
+    "%Y%d%m",
+    "%m-%d-%Y",
+    "%m/%d/%Y",
+    "%m.%d.%Y",
+    "%m%d%Y",
+)
+
+# strptime formats tried, in order, when validating and converting times
+_TIME_PATTERNS: tuple[str, ...] = (
+    "%H:%M:%S",
+    "%H:%M:%S.%f",
+    "%H:%M",
+    "%H%M",
+    "%H%M%S",
+    "%I:%M:%S.%f %p",
+    "%I:%M:%S %p",
+    "%I:%M %p",
+    "%I:%M:%S%p",
+    "%I:%M%p",
+)
+
+# strptime formats tried, in order, when validating and converting datetimes
+_DATETIME_PATTERNS: tuple[str, ...] = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y/%m/%dT%H:%M:%S",
+    "%Y.%m.%dT%H:%M:%S",
+    "%Y%m%d%H%M%S",
+    "%Y-%d-%mT%H:%M:%S",
+    "%Y/%d/%mT%H:%M:%S",
+    "%Y.%d.%mT%H:%M:%S",
+    "%Y%d%m%H%M%S",
+    "%m-%d-%YT%H:%M:%S",
+    "%m/%d/%YT%H:%M:%S",
+    "%m.%d.%YT%H:%M:%S",
+    "%m%d%Y%H%M%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y/%m/%dT%H:%M:%S.%f",
+    "%Y.%m.%dT%H:%M:%S.%f",
+    "%Y%m%d%H%M%S%f",
+    "%Y-%d-%mT%H:%M:%S.%f",
+    "%Y/%d/%mT%H:%M:%S.%f",
+    "%Y.%d.%mT%H:%M:%S.%f",
+    "%Y%d%m%H%M%S%f",
+    "%m-%d-%YT%H:%M:%S.%f",
+    "%m/%d/%YT%H:%M:%S.%f",
+    "%m.%d.%YT%H:%M:%S.%f",
+    "%m%d%Y%H%M%S%f",
+)
+
+
+
+def _group_patterns_by_separator(
+    patterns: tuple[str, ...]
+) -> dict[str, tuple[str, ...]]:
+    """
+    Group strptime formats by their first literal (non-directive) character.
+
+    Args:
+        patterns: strptime formats
+
+    Returns:
+        Formats keyed by their first literal character ('' if they have none),
+        in their original order
+    """
+    groups: dict[str, list[str]] = {}
+    for pattern in patterns:
+        groups.setdefault(re.sub(r"%.", "", pattern)[:1], []).append(pattern)
+    return {separator: tuple(group) for separator, group in groups.items()}
+
+
+def _first_separator(
+    value: str
+) -> str:
+    """
+    Get the first character of a value that is not a decimal digit or a space.
+
+    The directives used in the strptime formats only match digits (and the
+    space of a padded day), so a value can only match formats whose first
+    literal character is this separator. strptime accepts any Unicode decimal
+    digit, so fullwidth and other non-ASCII digits are skipped as well.
+
+    Args:
+        value: String to check
+
+    Returns:
+        The first separator character, or '' if the value has none
+    """
+    for char in value:
+        if not (char.isdecimal() or char == " "):
+            return char
+    return ""
+
+
+# Days in each month of a non-leap year
+_DAYS_IN_MONTH: tuple[int, ...] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_date(
+    year: int,
+    month: int,
+    day: int
+) -> bool:
+    """
+    Check if a year, month and day form a valid calendar date.
+
+    Args:
+        year: Year (1-9999)
+        month: Month (1-12)
+        day: Day of the month
+
+    Returns:
+        True if the components form a date that datetime.date accepts
+    """
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+
+    if month == 2 and (year % 4 == 0 and year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+
+    return day <= _DAYS_IN_MONTH[month - 1]
+
+
+_DATE_PATTERNS_BY_SEPARATOR: dict[str, tuple[str, ...]] = _group_patterns_by_separator(_DATE_PATTERNS)
+_TIME_PATTERNS_BY_SEPARATOR: dict[str, tuple[str, ...]] = _group_patterns_by_separator(_TIME_PATTERNS)
+_DATETIME_PATTERNS_BY_SEPARATOR: dict[str, tuple[str, ...]] = _group_patterns_by_separator(_DATETIME_PATTERNS)
+
+# Strings recognized as None and boolean values, compared in lower case
+_NONE_STRINGS: frozenset[str] = frozenset(("none", "null"))
+_BOOL_STRINGS: frozenset[str] = frozenset(("true", "false"))
+
+# Lengths of the strings above; anything else can skip the lower() call
+_NONE_STRING_LENGTHS: frozenset[int] = frozenset(map(len, _NONE_STRINGS))
+_BOOL_STRING_LENGTHS: frozenset[int] = frozenset(map(len, _BOOL_STRINGS))
+_NONE_BOOL_STRING_LENGTHS: frozenset[int] = _NONE_STRING_LENGTHS | _BOOL_STRING_LENGTHS
+
+# Number of distinct (value, trim) pairs remembered by String.infer_type
+_INFER_TYPE_CACHE_SIZE: int = 8192
+
+# Number of distinct strings remembered by each of to_date, to_datetime and to_time
+_PARSE_CACHE_SIZE: int = 65536
+
+# Number of values profile_values tallies at a time when given a list or tuple
+_PROFILE_BATCH_SIZE: int = 65536
+
+# Leading values of each batch checked for repeats before collapsing duplicates
+_PROFILE_SAMPLE_SIZE: int = 1024
+
+# Number of distinct types remembered by each of is_iterable and is_iterable_not_string
+_ITERABLE_TYPE_CACHE_SIZE: int = 256
+
+# Precompiled patterns used to screen values before the strptime checks. They carry no
+# ^/$ anchors and are applied with fullmatch, which the regex engine handles directly.
+# The numeric patterns allow one trailing newline, as the "$" anchor they replace did.
+_FLOAT_RE: re.Pattern[str] = re.compile(r"""[-+]?\d*\.\d*\n?""")
+_INT_RE: re.Pattern[str] = re.compile(r"""[-+]?\d+\n?""")
+_DATE_YMD_RE: re.Pattern[str] = re.compile(r"""(\d{4})([-/.]?)(\d{2})\2(\d{2})""")
+_DATE_MDY_RE: re.Pattern[str] = re.compile(r"""(\d{2})([-/.]?)(\d{2})\2(\d{4})""")
+# Year-first or month-first date, then the time; one alternation so each value is scanned once
+_DATETIME_RE: re.Pattern[str] = re.compile(
+    r"""(?:\d{4}[-/.]?\d{2}[-/.]?\d{2}|\d{2}[-/.]?\d{2}[-/.]?\d{4})[T]?\d{2}[:]?\d{2}(?:[:]?\d{2}(?:[.]?\d{5})?)?"""
+)
+# HH:MM[:SS[.ffffff]] with an optional AM/PM suffix, or compact HHMM[SS]
+_TIME_RE: re.Pattern[str] = re.compile(
+    r"""\d{1,2}:\d{2}(?::\d{2}(?:[.]\d+)?)?(?:\s*(?:AM|PM|am|pm))?|\d{4}(?:\d{2})?"""
+)
+
 
 class DataType(Enum):
     """
@@ -51,6 +231,287 @@ class DataType(Enum):
     EMPTY = "empty"
     NONE = "none"
 
+    # Position of the member in definition order, assigned below. profile_values uses it
+    # to index its per-type counts; a dict keyed by member would call Enum.__hash__,
+    # which is implemented in Python, for every value.
+    _index: int
+
+
+for _index, _data_type in enumerate(DataType):
+    _data_type._index = _index
+
+del _index, _data_type
+
+
+def _compatible_type_masks(
+    groups: Iterable[tuple[DataType, ...]]
+) -> frozenset[int]:
+    """
+    Build every bitmask of observed types that profile_values can still resolve.
+
+    Each bit is 1 << data_type._index. A mask is compatible when it is
+    a subset of one of the groups, with EMPTY allowed alongside any group.
+
+    Args:
+        groups: Sets of types that resolve to a single non-MIXED result
+
+    Returns:
+        Frozenset of all compatible masks
+    """
+    empty_bit: int = 1 << DataType.EMPTY._index
+    masks: set[int] = {0}
+    for group in groups:
+        group_mask: int = empty_bit
+        for data_type in group:
+            group_mask |= 1 << data_type._index
+        # Enumerate all subsets of group_mask
+        subset: int = group_mask
+        while subset:
+            masks.add(subset)
+            subset = (subset - 1) & group_mask
+
+    return frozenset(masks)
+
+
+# Once the observed types fall outside these masks, profile_values can only return MIXED
+_COMPATIBLE_TYPE_MASKS: frozenset[int] = _compatible_type_masks(
+    (
+        (DataType.NONE,),
+        (DataType.BOOLEAN,),
+        (DataType.DATE,),
+        (DataType.DATETIME,),
+        (DataType.TIME,),
+        (DataType.INTEGER, DataType.FLOAT),
+        (DataType.STRING,),
+    )
+)
+
+
+def _parse_date(
+    value: str
+) -> Union[date, None]:
+    """
+    Parse a string in one of the common date formats.
+
+    Validation and conversion happen in one step: the year, month and day are
+    read from the fixed-width digit groups and checked arithmetically, in the
+    same order the _DATE_PATTERNS strptime formats would be tried.
+
+    Args:
+        value: String to parse
+
+    Returns:
+        Parsed date, or None if string does not match a supported date format
+    """
+    # ISO-8601 values (YYYY-MM-DD) parse fastest with fromisoformat
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    match = _DATE_YMD_RE.fullmatch(value)
+    if match:
+        year, first, second = int(match[1]), int(match[3]), int(match[4])
+        if _is_valid_date(year, first, second):
+            return date(year, first, second)
+
+        if _is_valid_date(year, second, first):
+            return date(year, second, first)
+
+    # Compact values without separators also match the month-day-year layout
+    match = _DATE_MDY_RE.fullmatch(value)
+    if match:
+        year, month, day = int(match[4]), int(match[1]), int(match[3])
+        if _is_valid_date(year, month, day):
+            return date(year, month, day)
+
+    return None
+
+
+def _parse_time(
+    value: str
+) -> Union[time, None]:
+    """
+    Parse a string in one of the common time formats.
+
+    The first format that parses the value both validates and converts it, so
+    callers never need to run the strptime loop twice.
+
+    Args:
+        value: String to parse
+
+    Returns:
+        Parsed time, or None if string does not match a supported time format
+    """
+    if not _TIME_RE.fullmatch(value):
+        return None
+
+    # ISO-8601 values (HH:MM or HH:MM:SS) parse fastest with fromisoformat
+    if len(value) in (5, 8) and value[2] == ":":
+        try:
+            return time.fromisoformat(value)
+        except ValueError:
+            pass
+
+    for pattern in _TIME_PATTERNS_BY_SEPARATOR.get(_first_separator(value), ()):
+        try:
+            return datetime.strptime(value, pattern).time()
+        except ValueError:
+            pass
+
+    return None
+
+
+def _parse_datetime(
+    value: str
+) -> Union[datetime, None]:
+    """
+    Parse a string in one of the common datetime formats.
+
+    The first format that parses the value both validates and converts it, so
+    callers never need to run the strptime loop twice.
+
+    Args:
+        value: String to parse
+
+    Returns:
+        Parsed datetime, or None if string does not match a supported datetime format
+    """
+    if not _DATETIME_RE.fullmatch(value):
+        return None
+
+    # ISO-8601 values (YYYY-MM-DDTHH:MM:SS) parse fastest with fromisoformat
+    if len(value) == 19 and value[4] == "-" and value[7] == "-" and value[10] == "T":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    for pattern in _DATETIME_PATTERNS_BY_SEPARATOR.get(_first_separator(value), ()):
+        try:
+            return datetime.strptime(value, pattern)
+        except ValueError:
+            pass
+
+    return None
+
+
+# Compact all-digit layouts keyed by their length, with the parser and type for each.
+# No other length of digits can be a date, time or datetime.
+_DIGIT_STRING_PARSERS: dict[int, tuple[typing.Callable[[str], Any], DataType]] = {
+    4: (_parse_time, DataType.TIME),  # HHMM
+    6: (_parse_time, DataType.TIME),  # HHMMSS
+    8: (_parse_date, DataType.DATE),  # YYYYMMDD, YYYYDDMM, MMDDYYYY
+    12: (_parse_datetime, DataType.DATETIME),  # YYYYMMDDHHMM
+    14: (_parse_datetime, DataType.DATETIME),  # YYYYMMDDHHMMSS
+    19: (_parse_datetime, DataType.DATETIME),  # YYYYMMDDHHMMSSfffff
+}
+
+
+def _infer_string_type(
+    value: str,
+    trim: bool
+) -> DataType:
+    """
+    Infer the data type of a string value.
+
+    Results are memoized through _infer_string_type_cached, since tabular data
+    tends to repeat the same values many times.
+
+    Args:
+        value: String value to check
+        trim: Whether to trim whitespace before checking
+
+    Returns:
+        DataType enum value representing the inferred type
+    """
+    # Strip the value once rather than in every is_*_like check
+    tmp_value: str = value.strip() if trim else value
+
+    # Only values as long as "none", "null", "true" or "false" need lowering
+    if len(tmp_value) in _NONE_BOOL_STRING_LENGTHS:
+        lower_value: str = tmp_value.lower()
+
+        if lower_value in _NONE_STRINGS:
+            return DataType.NONE
+
+        if lower_value in _BOOL_STRINGS:
+            return DataType.BOOLEAN
+
+    if not tmp_value:
+        return DataType.EMPTY
+
+    # Every remaining type starts with a digit, a sign or a decimal point
+    first_char: str = tmp_value[0]
+    if not (first_char.isdecimal() or first_char in "+-."):
+        return DataType.STRING
+
+    # All-digit values can only be the compact date/time layout of their length, or an integer
+    if tmp_value.isdecimal():
+        parser, data_type = _DIGIT_STRING_PARSERS.get(len(tmp_value), (None, DataType.INTEGER))
+        if parser is not None and parser(tmp_value) is None:
+            return DataType.INTEGER
+
+        return data_type
+
+    # Only times and datetimes contain a colon
+    if ":" in tmp_value:
+        if _parse_datetime(tmp_value) is not None:
+            return DataType.DATETIME
+
+        if _parse_time(tmp_value) is not None:
+            return DataType.TIME
+
+        return DataType.STRING
+
+    if _parse_date(tmp_value) is not None:
+        return DataType.DATE
+
+    if _INT_RE.fullmatch(tmp_value):
+        return DataType.INTEGER
+
+    if _FLOAT_RE.fullmatch(tmp_value):
+        return DataType.FLOAT
+
+    return DataType.STRING
+
+
+def _infer_non_string_type(
+    value: Any
+) -> DataType:
+    """
+    Infer the data type of a value that is not a string.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        DataType enum value representing the type of the value
+    """
+    if value is None:
+        return DataType.NONE
+
+    if isinstance(value, bool):
+        return DataType.BOOLEAN
+
+    if isinstance(value, datetime):
+        return DataType.DATETIME
+
+    if isinstance(value, time):
+        return DataType.TIME
+
+    if isinstance(value, date):
+        return DataType.DATE
+
+    if isinstance(value, int):
+        return DataType.INTEGER
+
+    if isinstance(value, float):
+        return DataType.FLOAT
+
+    return DataType.STRING
+
 
 class String:
     """
@@ -88,8 +549,15 @@ class String:
             return True
 
         if isinstance(value, str):
-            tmp_value: str = value.lower().strip() if trim else value.lower()
-            return tmp_value in ["true", "false"]
+            tmp_value: str = value.strip() if trim else value
+            if len(tmp_value) not in _BOOL_STRING_LENGTHS:
+                return False
+
+            # Already-lowercase values can be looked up without allocating a lowered copy
+            if tmp_value in _BOOL_STRINGS:
+                return True
+
+            return tmp_value.lower() in _BOOL_STRINGS
 
         return False
 
@@ -118,8 +586,15 @@ class String:
             return True
 
         if isinstance(value, str):
-            tmp_value: str = value.strip().lower() if trim else value.lower()
-            return tmp_value in ["none", "null"]
+            tmp_value: str = value.strip() if trim else value
+            if len(tmp_value) not in _NONE_STRING_LENGTHS:
+                return False
+
+            # Already-lowercase values can be looked up without allocating a lowered copy
+            if tmp_value in _NONE_STRINGS:
+                return True
+
+            return tmp_value.lower() in _NONE_STRINGS
 
         return False
 
@@ -148,7 +623,8 @@ class String:
         if not isinstance(value, str):
             return False
 
-        return not value.strip() if trim else not value
+        # isspace() tests for whitespace-only without allocating the stripped copy
+        return not value or (trim and value.isspace())
 
     @staticmethod
     def is_float_like(
@@ -181,7 +657,7 @@ class String:
             return False
 
         return (
-            re.match(r"""^[-+]?(\d+)?\.(\d+)?$""", value.strip() if trim else value)
+            _FLOAT_RE.fullmatch(value.strip() if trim else value)
             is not None
         )
 
@@ -216,7 +692,8 @@ class String:
             return False
 
         tmp_value: str = value.strip() if trim else value
-        return re.match(r"""^[-+]?\d+$""", tmp_value) is not None
+        # Unsigned digit runs, by far the common case, skip the regex engine
+        return tmp_value.isdecimal() or _INT_RE.fullmatch(tmp_value) is not None
 
     @classmethod
     def is_numeric_like(
@@ -279,6 +756,9 @@ class String:
         """
         Internal method to check if string matches common date formats.
 
+        The year, month and day are read from the fixed-width digit groups and
+        validated arithmetically, without building a datetime for each format.
+
         Args:
             value: String to check
 
@@ -293,29 +773,7 @@ class String:
             - YYYYMMDD
             And their variations with different date component orders
         """
-        patterns: list[str] = [
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y.%m.%d",
-            "%Y%m%d",
-            "%Y-%d-%m",
-            "%Y/%d/%m",
-            "%Y.%d.%m",
-            "%Y%d%m",
-            "%m-%d-%Y",
-            "%m/%d/%Y",
-            "%m.%d.%Y",
-            "%m%d%Y",
-        ]
-
-        for pattern in patterns:
-            try:
-                datetime.strptime(value, pattern)
-                return True
-            except ValueError:
-                pass
-
-        return False
+        return _parse_date(value) is not None
 
     @staticmethod
     def _is_time_like(
@@ -339,27 +797,7 @@ class String:
             - HHMM
             And 12-hour format variations with AM/PM
         """
-        patterns: list[str] = [
-            "%H:%M:%S",
-            "%H:%M:%S.%f",
-            "%H:%M",
-            "%H%M",
-            "%H%M%S",
-            "%I:%M:%S.%f %p",
-            "%I:%M:%S %p",
-            "%I:%M %p",
-            "%I:%M:%S%p",
-            "%I:%M%p",
-        ]
-
-        for pattern in patterns:
-            try:
-                datetime.strptime(value, pattern)
-                return True
-            except ValueError:
-                pass
-
-        return False
+        return _parse_time(value) is not None
 
     @classmethod
     def is_date_like(
@@ -394,17 +832,7 @@ class String:
 
         tmp_value: str = value.strip() if trim else value
 
-        if re.match(
-            r"""^\d{4}[-/.]?\d{2}[-/.]?\d{2}$""", tmp_value
-        ) and cls._is_date_like(tmp_value):
-            return True
-
-        if re.match(
-            r"""^\d{2}[-/.]?\d{2}[-/.]?\d{4}$""", tmp_value
-        ) and cls._is_date_like(tmp_value):
-            return True
-
-        return False
+        return cls._is_date_like(tmp_value)
 
     @staticmethod
     def _is_datetime_like(
@@ -427,41 +855,7 @@ class String:
             - YYYYMMDDHHMMSS
             And their variations with different date component orders and optional microseconds
         """
-        patterns: list[str] = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y/%m/%dT%H:%M:%S",
-            "%Y.%m.%dT%H:%M:%S",
-            "%Y%m%d%H%M%S",
-            "%Y-%d-%mT%H:%M:%S",
-            "%Y/%d/%mT%H:%M:%S",
-            "%Y.%d.%mT%H:%M:%S",
-            "%Y%d%m%H%M%S",
-            "%m-%d-%YT%H:%M:%S",
-            "%m/%d/%YT%H:%M:%S",
-            "%m.%d.%YT%H:%M:%S",
-            "%m%d%Y%H%M%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y/%m/%dT%H:%M:%S.%f",
-            "%Y.%m.%dT%H:%M:%S.%f",
-            "%Y%m%d%H%M%S%f",
-            "%Y-%d-%mT%H:%M:%S.%f",
-            "%Y/%d/%mT%H:%M:%S.%f",
-            "%Y.%d.%mT%H:%M:%S.%f",
-            "%Y%d%m%H%M%S%f",
-            "%m-%d-%YT%H:%M:%S.%f",
-            "%m/%d/%YT%H:%M:%S.%f",
-            "%m.%d.%YT%H:%M:%S.%f",
-            "%m%d%Y%H%M%S%f",
-        ]
-
-        for pattern in patterns:
-            try:
-                datetime.strptime(value, pattern)
-                return True
-            except ValueError:
-                pass
-
-        return False
+        return _parse_datetime(value) is not None
 
     @classmethod
     def is_datetime_like(
@@ -496,19 +890,7 @@ class String:
 
         tmp_value: str = value.strip() if trim else value
 
-        if re.match(
-            r"""^\d{4}[-/.]?\d{2}[-/.]?\d{2}[T]?\d{2}[:]?\d{2}([:]?\d{2}([.]?\d{5})?)?$""",
-            tmp_value,
-        ) and cls._is_datetime_like(tmp_value):
-            return True
-
-        if re.match(
-            r"""^\d{2}[-/.]?\d{2}[-/.]?\d{4}[T]?\d{2}[:]?\d{2}([:]?\d{2}([.]?\d{5})?)?$""",
-            tmp_value,
-        ) and cls._is_datetime_like(tmp_value):
-            return True
-
-        return False
+        return cls._is_datetime_like(tmp_value)
 
     @classmethod
     def is_time_like(
@@ -545,22 +927,7 @@ class String:
 
         tmp_value: str = value.strip() if trim else value
 
-        if re.match(
-            r"""^(\d{1,2}):(\d{2})(:(\d{2})([.](\d+))?)?$""", tmp_value
-        ) and cls._is_time_like(tmp_value):
-            return True
-
-        if re.match(
-            r"""^(\d{1,2}):(\d{2})(:(\d{2})([.](\d+))?)?\s*(AM|PM|am|pm)$""", tmp_value
-        ) and cls._is_time_like(tmp_value):
-            return True
-
-        if re.match(
-            r"""^(\d{2})(\d{2})(\d{2})?$""", tmp_value
-        ) and cls._is_time_like(tmp_value):
-            return True
-
-        return False
+        return cls._is_time_like(tmp_value)
 
     @classmethod
     def to_bool(
@@ -671,37 +1038,19 @@ class String:
             >>> String.to_date('01/01/2023')  # datetime.date(2023, 1, 1)
             >>> String.to_date('invalid')     # None
         """
+        # datetime is a subclass of date, so it must be checked first
+        if isinstance(value, datetime):
+            return value.date()
+
         if isinstance(value, date):
             return value
 
-        if not cls.is_date_like(value, trim=trim):
+        if not isinstance(value, str):
             return default
 
-        patterns: list[str] = [
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y.%m.%d",
-            "%Y%m%d",
-            "%Y-%d-%m",
-            "%Y/%d/%m",
-            "%Y.%d.%m",
-            "%Y%d%m",
-            "%m-%d-%Y",
-            "%m/%d/%Y",
-            "%m.%d.%Y",
-            "%m%d%Y",
-        ]
-
-        dvalue: str = value.strip() if trim else value
-
-        for pattern in patterns:
-            try:
-                tmp_value = datetime.strptime(dvalue, pattern)
-                return tmp_value.date()
-            except ValueError:
-                pass
+        parsed: Union[date, None] = _parse_date_cached(value.strip() if trim else value)
 
-        return default
+        return default if parsed is None else parsed
 
     @classmethod
     def to_datetime(
@@ -730,46 +1079,12 @@ class String:
         if isinstance(value, datetime):
             return value
 
-        if not cls.is_datetime_like(value, trim=trim):
+        if not isinstance(value, str):
             return default
 
-        patterns: list[str] = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y/%m/%dT%H:%M:%S",
-            "%Y.%m.%dT%H:%M:%S",
-            "%Y%m%d%H%M%S",
-            "%Y-%d-%mT%H:%M:%S",
-            "%Y/%d/%mT%H:%M:%S",
-            "%Y.%d.%mT%H:%M:%S",
-            "%Y%d%m%H%M%S",
-            "%m-%d-%YT%H:%M:%S",
-            "%m/%d/%YT%H:%M:%S",
-            "%m.%d.%YT%H:%M:%S",
-            "%m%d%Y%H%M%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y/%m/%dT%H:%M:%S.%f",
-            "%Y.%m.%dT%H:%M:%S.%f",
-            "%Y%m%d%H%M%S%f",
-            "%Y-%d-%mT%H:%M:%S.%f",
-            "%Y/%d/%mT%H:%M:%S.%f",
-            "%Y.%d.%mT%H:%M:%S.%f",
-            "%Y%d%m%H%M%S%f",
-            "%m-%d-%YT%H:%M:%S.%f",
-            "%m/%d/%YT%H:%M:%S.%f",
-            "%m.%d.%YT%H:%M:%S.%f",
-            "%m%d%Y%H%M%S%f",
-        ]
-
-        tmp_value: str = value.strip() if trim else value
+        parsed: Union[datetime, None] = _parse_datetime_cached(value.strip() if trim else value)
 
-        for pattern in patterns:
-            try:
-                tvalue = datetime.strptime(tmp_value, pattern)
-                return tvalue
-            except ValueError:
-                pass
-
-        return default
+        return default if parsed is None else parsed
 
     @classmethod
     def to_time(
@@ -799,32 +1114,24 @@ class String:
         if isinstance(value, time):
             return value
 
-        if not cls.is_time_like(value, trim=trim):
+        if not isinstance(value, str):
             return default
 
-        patterns: list[str] = [
-            "%H:%M:%S",
-            "%H:%M:%S.%f",
-            "%H:%M",
-            "%H%M",
-            "%H%M%S",
-            "%I:%M:%S.%f %p",
-            "%I:%M:%S %p",
-            "%I:%M %p",
-            "%I:%M:%S%p",
-            "%I:%M%p",
-        ]
+        parsed: Union[time, None] = _parse_time_cached(value.strip() if trim else value)
 
-        tmp_value: str = value.strip() if trim else value
+        return default if parsed is None else parsed
 
-        for pattern in patterns:
-            try:
-                tvalue = datetime.strptime(tmp_value, pattern)
-                return tvalue.time()
-            except ValueError:
-                pass
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """
+        Clear the caches of strings already parsed by to_date, to_datetime and to_time.
 
-        return default
+        Examples:
+            >>> String.clear_parse_cache()
+        """
+        _parse_date_cached.cache_clear()
+        _parse_datetime_cached.cache_clear()
+        _parse_time_cached.cache_clear()
 
     @staticmethod
     def has_leading_zero(
@@ -876,31 +1183,20 @@ class String:
             >>> String.infer_type('true')          # DataType.BOOLEAN
             >>> String.infer_type('abc')           # DataType.STRING
         """
-        if cls.is_none_like(value, trim=trim):
-            return DataType.NONE
-
-        if cls.is_bool_like(value, trim=trim):
-            return DataType.BOOLEAN
-
-        if cls.is_datetime_like(value, trim=trim):
-            return DataType.DATETIME
-
-        if cls.is_time_like(value, trim=trim):
-            return DataType.TIME
-
-        if cls.is_date_like(value, trim=trim):
-            return DataType.DATE
-
-        if cls.is_int_like(value, trim=trim):
-            return DataType.INTEGER
+        if not isinstance(value, str):
+            return _infer_non_string_type(value)
 
-        if cls.is_float_like(value, trim=trim):
-            return DataType.FLOAT
+        return _infer_string_type_cached(value, trim)
 
-        if cls.is_empty_like(value, trim=trim):
-            return DataType.EMPTY
+    @classmethod
+    def clear_infer_type_cache(cls) -> None:
+        """
+        Clear the cache of string values already classified by infer_type.
 
-        return DataType.STRING
+        Examples:
+            >>> String.clear_infer_type_cache()
+        """
+        _infer_string_type_cached.cache_clear()
 
     @classmethod
     def infer_type_name(
@@ -929,7 +1225,154 @@ class String:
         return cls.infer_type(value, trim=trim).name
 
 
-def profile_values(values: Iterable, *, trim: bool = True) -> DataType:
+_infer_string_type_cached = lru_cache(maxsize=_INFER_TYPE_CACHE_SIZE)(_infer_string_type)
+
+# date, datetime and time objects are immutable, so cached results can be shared between callers
+_parse_date_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse_date)
+_parse_datetime_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse_datetime)
+_parse_time_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse_time)
+
+
+def _count_batch_types(
+    batch: Union[list, tuple],
+    infer_string_type: typing.Callable[[str, bool], DataType],
+    trim: bool
+) -> list[tuple[int, int]]:
+    """
+    Count the inferred types of a batch of values.
+
+    Duplicate values are collapsed with Counter first, so each distinct string
+    is inferred once per batch rather than once per occurrence. Batches whose
+    leading sample is mostly distinct, or that hold unhashable or non-string
+    values, fall back to inferring every value; Counter would only add overhead
+    for the former and would merge equal values of different types (e.g. 1, 1.0
+    and True) for the latter.
+
+    Args:
+        batch: Values to classify
+        infer_string_type: Function used to infer the type of a string value
+        trim: Whether to trim whitespace before checking
+
+    Returns:
+        List of (type index, number of values) pairs, one per type present
+    """
+    batch_counts: dict[int, int] = {}
+
+    value_counts: Counter = Counter()
+    try:
+        if len(set(batch[:_PROFILE_SAMPLE_SIZE])) * 2 <= min(len(batch), _PROFILE_SAMPLE_SIZE):
+            value_counts = Counter(batch)
+
+    except TypeError:
+        pass
+
+    if value_counts and all(isinstance(value, str) for value in value_counts):
+        for value, number in value_counts.items():
+            index = infer_string_type(value, trim)._index
+            batch_counts[index] = batch_counts.get(index, 0) + number
+    else:
+        for value in batch:
+            if isinstance(value, str):
+                index = infer_string_type(value, trim)._index
+            else:
+                index = _infer_non_string_type(value)._index
+            batch_counts[index] = batch_counts.get(index, 0) + 1
+
+    return list(batch_counts.items())
+
+
+def _as_value_list(
+    values: Iterable
+) -> Union[list, None]:
+    """
+    Convert an array-like collection to a list of native Python values.
+
+    numpy arrays, pandas Series and Index objects expose tolist(), and pyarrow
+    arrays expose to_pylist(). Both convert in native code and yield plain str,
+    int, float and None values instead of the library's scalar types.
+
+    Args:
+        values: Collection of values to convert
+
+    Returns:
+        List of values, or None if values has no such conversion
+    """
+    for method_name in ("tolist", "to_pylist"):
+        convert = getattr(values, method_name, None)
+        if callable(convert):
+            converted = convert()
+            if isinstance(converted, list):
+                return converted
+
+    return None
+
+
+def _sample_values(
+    values: Iterable,
+    sample_size: int,
+    rng: Union[random.Random, None] = None
+) -> Union[list, tuple]:
+    """
+    Take the leading values of a collection plus a uniform random sample of the rest.
+
+    Lists and tuples are sampled by index without visiting the values in between.
+    Other iterables are read to the end once, keeping a reservoir sample of the
+    values after the leading ones, but no value outside the sample is inferred.
+
+    Args:
+        values: Collection of values to sample
+        sample_size: Number of leading values and number of sampled values to take
+        rng: Random number generator to sample with; the module-level generator
+            shared with random.seed() if None
+
+    Returns:
+        The leading values followed by the sampled values, or every value if there
+        are no more than 2 * sample_size of them
+    """
+    if rng is None:
+        sample, draw, randrange = random.sample, random.random, random.randrange
+    else:
+        sample, draw, randrange = rng.sample, rng.random, rng.randrange
+
+    if isinstance(values, (list, tuple)):
+        if len(values) <= 2 * sample_size:
+            return values
+
+        indexes = sorted(sample(range(sample_size, len(values)), sample_size))
+        return list(values[:sample_size]) + [values[index] for index in indexes]
+
+    iterator = iter(values)
+    head: list = list(islice(iterator, sample_size))
+    reservoir: list = list(islice(iterator, sample_size))
+
+    if len(reservoir) < sample_size:
+        return head + reservoir
+
+    # Algorithm L: jump straight to the next value that enters the reservoir, letting
+    # islice skip the values in between instead of drawing a random number for each.
+    # 1.0 - draw() lies in (0, 1], so its log is always defined.
+    weight = math.exp(math.log(1.0 - draw()) / sample_size)
+    while weight < 1.0:
+        skip = math.floor(math.log(1.0 - draw()) / math.log(1.0 - weight))
+        for value in islice(iterator, skip, skip + 1):
+            reservoir[randrange(sample_size)] = value
+            break
+        else:
+            break
+
+        weight *= math.exp(math.log(1.0 - draw()) / sample_size)
+
+    return head + reservoir
+
+
+def profile_values(
+    values: Iterable,
+    *,
+    trim: bool = True,
+    no_cache: bool = False,
+    sample_size: Union[int, None] = None,
+    rng: Union[random.Random, None] = None
+) -> DataType:
     """
     Infer the most appropriate data type for a collection of values.
 
@@ -939,73 +1382,111 @@ def profile_values(values: Iterable, *, trim: bool = True) -> DataType:
     Args:
         values: Collection of values to analyze
         trim: Whether to trim whitespace before checking
+        no_cache: Whether to bypass the infer_type cache, e.g. for high-cardinality
+            columns that would only evict more useful entries
+        sample_size: If given, profile only the first sample_size values plus a
+            random sample of sample_size of the remaining values. The result is then
+            an estimate: a rare value of another type outside the sample is missed.
+        rng: Random number generator for sample_size, e.g. random.Random(seed) for
+            a repeatable sample; the module-level generator if None
 
     Returns:
         DataType enum value representing the inferred type
 
     Raises:
-        ValueError: If values is not iterable
+        ValueError: If values is not iterable or sample_size is not positive
 
     Examples:
         >>> profile_values(['1', '2', '3'])           # DataType.INTEGER
         >>> profile_values(['1.1', '2.2', '3.3'])     # DataType.FLOAT
         >>> profile_values(['1', '2.2', 'abc'])       # DataType.MIXED
         >>> profile_values(['true', 'false'])         # DataType.BOOLEAN
+        >>> profile_values(rows, sample_size=1000)    # first 1000 plus 1000 sampled values
     """
-    types = {
-        DataType.BOOLEAN.name: 0,
-        DataType.DATE.name: 0,
-        DataType.TIME.name: 0,
-        DataType.DATETIME.name: 0,
-        DataType.INTEGER.name: 0,
-        DataType.FLOAT.name: 0,
-        DataType.STRING.name: 0,
-        DataType.EMPTY.name: 0,
-        DataType.NONE.name: 0,
-    }
-
     if not is_iterable_not_string(values):
         raise ValueError("values must be iterable")
 
-    count = 0
+    if sample_size is not None and sample_size < 1:
+        raise ValueError("sample_size must be positive")
 
-    for value in values:
-        types[String.infer_type(value, trim=trim).name] += 1
-        count += 1
-
-    if types[DataType.EMPTY.name] == count:
+    infer_string_type = _infer_string_type if no_cache else _infer_string_type_cached
+    counts = [0] * len(DataType)
+    count = 0
+    seen = 0
+
+    if not isinstance(values, (list, tuple)):
+        converted = _as_value_list(values)
+        if converted is not None:
+            values = converted
+
+    if sample_size is not None:
+        values = _sample_values(values, sample_size, rng)
+
+    if isinstance(values, (list, tuple)):
+        # Lists, tuples and converted arrays are tallied in batches of distinct values
+        for start in range(0, len(values), _PROFILE_BATCH_SIZE):
+            batch = values[start:start + _PROFILE_BATCH_SIZE]
+            for index, number in _count_batch_types(batch, infer_string_type, trim):
+                counts[index] += number
+                count += number
+
+                # The first time a type is seen, stop if no remaining values could avoid MIXED
+                if counts[index] == number:
+                    seen |= 1 << index
+                    if seen not in _COMPATIBLE_TYPE_MASKS:
+                        return DataType.MIXED
+    else:
+        # Other iterables are consumed one value at a time, counting into a list
+        # indexed by DataType._index rather than a dict keyed by name
+        for value in values:
+            if isinstance(value, str):
+                index = infer_string_type(value, trim)._index
+            else:
+                index = _infer_non_string_type(value)._index
+            counts[index] += 1
+            count += 1
+
+            # The first time a type is seen, stop if no remaining values could avoid MIXED
+            if counts[index] == 1:
+                seen |= 1 << index
+                if seen not in _COMPATIBLE_TYPE_MASKS:
+                    return DataType.MIXED
+
+    types = dict(zip(DataType, counts))
+
+    if types[DataType.EMPTY] == count:
         return DataType.EMPTY
 
-    if types[DataType.NONE.name] == count:
+    if types[DataType.NONE] == count:
         return DataType.NONE
 
-    if types[DataType.NONE.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.NONE] + types[DataType.EMPTY] == count:
         return DataType.NONE
 
-    if types[DataType.BOOLEAN.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.BOOLEAN] + types[DataType.EMPTY] == count:
         return DataType.BOOLEAN
 
-    if types[DataType.DATE.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.DATE] + types[DataType.EMPTY] == count:
         return DataType.DATE
 
-    if types[DataType.DATETIME.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.DATETIME] + types[DataType.EMPTY] == count:
         return DataType.DATETIME
 
-    if types[DataType.TIME.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.TIME] + types[DataType.EMPTY] == count:
         return DataType.TIME
 
-    if types[DataType.INTEGER.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.INTEGER] + types[DataType.EMPTY] == count:
         return DataType.INTEGER
 
     if (
-        types[DataType.FLOAT.name]
-        + types[DataType.INTEGER.name]
-        + types[DataType.EMPTY.name]
+        types[DataType.FLOAT]
+        + types[DataType.INTEGER]
+        + types[DataType.EMPTY]
         == count
     ):
         return DataType.FLOAT
 
-    if types[DataType.STRING.name] + types[DataType.EMPTY.name] == count:
+    if types[DataType.STRING] + types[DataType.EMPTY] == count:
         return DataType.STRING
 
     return DataType.MIXED
@@ -1064,6 +1545,25 @@ def is_dict_like(value: Any) -> bool:
     return False
 
 
+@lru_cache(maxsize=_ITERABLE_TYPE_CACHE_SIZE)
+def _is_iterable_type(
+    value_type: type
+) -> bool:
+    """
+    Check if instances of a type are iterable.
+
+    The check goes through collections.abc.Iterable, which looks for __iter__ on the
+    type's MRO (not its metaclass) and honours ABC registration. The answer is cached per type.
+
+    Args:
+        value_type: Type to check
+
+    Returns:
+        True if value_type is an Iterable
+    """
+    return issubclass(value_type, collections.abc.Iterable)
+
+
 def is_iterable(value: Any) -> bool:
     """
     Check if value is iterable.
@@ -1072,7 +1572,7 @@ def is_iterable(value: Any) -> bool:
         value: Value to check
 
     Returns:
-        True if value is iterable (has __iter__, __getitem__, __len__, __next__ methods)
+        True if value is iterable (defines __iter__ or is registered as Iterable)
 
     Examples:
         >>> is_iterable([1, 2, 3])         # True
@@ -1080,18 +1580,26 @@ def is_iterable(value: Any) -> bool:
         >>> is_iterable('abc')             # True
         >>> is_iterable(123)               # False
     """
-    if isinstance(value, (collections.abc.Iterable, typing.Iterable)):
-        return True
+    value_type: type = type(value)
+    return _is_iterable_type(value_type)
 
-    if (
-        hasattr(value, "__iter__")
-        and hasattr(value, "__getitem__")
-        and hasattr(value, "__len__")
-        and hasattr(value, "__next__")
-    ):
-        return True
 
-    return False
+@lru_cache(maxsize=_ITERABLE_TYPE_CACHE_SIZE)
+def _is_iterable_not_string_type(
+    value_type: type
+) -> bool:
+    """
+    Check if instances of a type are iterable but not strings.
+
+    Iterability is a property of the type, so the answer is cached per type.
+
+    Args:
+        value_type: Type to check
+
+    Returns:
+        True if value_type is an Iterable and not a str subclass
+    """
+    return not issubclass(value_type, str) and issubclass(value_type, collections.abc.Iterable)
 
 
 def is_iterable_not_string(value: Any) -> bool:
@@ -1110,10 +1618,18 @@ def is_iterable_not_string(value: Any) -> bool:
         >>> is_iterable_not_string('abc')      # False
         >>> is_iterable_not_string(123)        # False
     """
-    if not isinstance(value, str) and is_iterable(value):
-        return True
+    value_type: type = type(value)
+    if value_type is str:
+        return False
 
-    return False
+    return _is_iterable_not_string_type(value_type)
+
+
+# Exact types whose values are empty exactly when falsy: None and the builtin containers
+_EMPTY_WHEN_FALSY_TYPES: frozenset[type] = frozenset((type(None), list, tuple, set, frozenset, dict))
+
+# Every type is_empty can report as empty, subclasses included; built once rather than per call
+_EMPTY_CHECK_TYPES: tuple[type, ...] = (str, list, tuple, set, frozenset, dict)
 
 
 def is_empty(value: Any) -> bool:
@@ -1135,16 +1651,87 @@ def is_empty(value: Any) -> bool:
         >>> is_empty('abc')          # False
         >>> is_empty([1, 2, 3])      # False
     """
-    if value is None:
-        return True
+    # Exact builtin types resolve with one identity check or set lookup; subclasses fall through to isinstance below.
+    # str is tested first because text cells (CSV, DSV, parsed columns) dominate the input by a wide margin.
+    value_type = type(value)
+    if value_type is str:
+        return not value or value.isspace()
 
-    if isinstance(value, str) and not value.strip():
-        return True
+    if value_type in _EMPTY_WHEN_FALSY_TYPES:
+        return not value
 
-    if isinstance(value, (list, tuple, set)) and not value:
-        return True
+    # Only supported types are tested for truthiness; __bool__ on arbitrary objects may raise (e.g. arrays)
+    return isinstance(value, _EMPTY_CHECK_TYPES) and (not value or (isinstance(value, str) and value.isspace()))
 
-    if isinstance(value, dict) and not value:
-        return True
 
-    return False
+def is_empty_str(value: Union[str, None]) -> bool:
+    """
+    Check if a string value is empty, skipping is_empty's type dispatch.
+
+    For callers that know value is a str or None, such as CSV cells.
+
+    Args:
+        value: String or None to check
+
+    Returns:
+        True if value is None, empty or whitespace-only
+
+    Examples:
+        >>> is_empty_str(None)       # True
+        >>> is_empty_str('   ')      # True
+        >>> is_empty_str('abc')      # False
+    """
+    return value is None or not value or value.isspace()
+
+
+def is_empty_list(value: Union[list, tuple, set, frozenset, dict, None]) -> bool:
+    """
+    Check if a container value is empty, skipping is_empty's type dispatch.
+
+    For callers that know value is a list (or other builtin container) or None, such as rows.
+
+    Args:
+        value: Container or None to check
+
+    Returns:
+        True if value is None or has no items
+
+    Examples:
+        >>> is_empty_list(None)      # True
+        >>> is_empty_list([])        # True
+        >>> is_empty_list([1, 2])    # False
+    """
+    return value is None or not value
+
+
+def is_empty_many(values: Iterable[Any]) -> list[bool]:
+    """
+    Check each value in an iterable for emptiness.
+
+    Equivalent to [is_empty(value) for value in values], but strings, None and builtin
+    containers are tested inline, saving a function call per cell on text columns and
+    parsed JSON payloads. Array-like columns (numpy,
+    pandas, pyarrow) are converted to native values first, so their cells take the same
+    fast paths instead of falling back to isinstance checks on library scalar types.
+
+    Args:
+        values: Values to check
+
+    Returns:
+        List with is_empty(value) for each value, in order. bytes() of the result is a
+        one-byte-per-value mask that numpy.frombuffer(mask, dtype=bool) can view without copying.
+
+    Examples:
+        >>> is_empty_many(['a', '', ' ', None, [1]])  # [False, True, True, True, False]
+        >>> bytes(is_empty_many(['a', '']))            # b'\\x00\\x01'
+    """
+    converted = _as_value_list(values)
+    if converted is not None:
+        values = converted
+
+    return [
+        (not value or value.isspace()) if type(value) is str
+        else not value if type(value) in _EMPTY_WHEN_FALSY_TYPES
+        else is_empty(value)
+        for value in values
+    ]
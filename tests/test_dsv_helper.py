@@ -1,5 +1,6 @@
 """Unit tests for DSVHelper class."""
 
+import io
 import math
 import tempfile
 import unittest
@@ -161,6 +162,15 @@ class TestDSVHelper(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_parse_stream_text_stream(self):
+        """Test parse_stream with an open text stream instead of a file path."""
+        text_stream = io.StringIO("header1,header2\na, b\nc,d\nfooter1,footer2\n")
+        chunks = list(DsvHelper.parse_stream(
+            text_stream, ",", chunk_size=100, skip_header_rows=1, skip_footer_rows=1
+        ))
+        self.assertEqual(chunks, [[["a", "b"], ["c", "d"]]])
+        self.assertFalse(text_stream.closed)
+
     def test_parse_stream_iteration(self):
         """Test iterating over parse_stream yields correct data."""
         total_rows = 2499
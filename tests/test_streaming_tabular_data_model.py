@@ -6,215 +6,280 @@ Copyright (c) 2025, Jim Schilling
 This module is licensed under the MIT License.
 """
 
+import io
+from collections import Counter
+
 import pytest
-import tempfile
-import os
 from typing import Iterator
 
 from splurge_tools.dsv_helper import DsvHelper
 from splurge_tools.streaming_tabular_data_model import StreamingTabularDataModel
 
 
-class TestStreamingTabularDataModel:
-    """Test cases for StreamingTabularDataModel."""
-
-    def test_streaming_model_with_headers(self) -> None:
-        """Test StreamingTabularDataModel with header rows."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age,City\n")
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            f.write("Bob,35,Chicago\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test column names
-            assert model.column_names == ["Name", "Age", "City"]
-            assert model.column_count == 3
-
-            # Test column index
-            assert model.column_index("Name") == 0
-            assert model.column_index("Age") == 1
-            assert model.column_index("City") == 2
+# Chunk size for tests that don't exercise chunk or buffer boundaries; fewer, larger chunks per stream
+DEFAULT_TEST_CHUNK: int = 4096
+
+# CSV text for each csv_files payload, built once at import
+CSV_PAYLOADS: dict[str, str] = {
+    "headers": "Name,Age,City\nJohn,25,New York\nJane,30,Los Angeles\nBob,35,Chicago\n",
+    "no_headers": "John,25,New York\nJane,30,Los Angeles\nBob,35,Chicago\n",
+    "no_headers_two_rows": "John,25,New York\nJane,30,Los Angeles\n",
+    "multi_row_headers": "Personal,Personal,Location\nName,Age,City\nJohn,25,New York\nJane,30,Los Angeles\n",
+    "header_only": "Name,Age\n",
+    "name_age_two_rows": "Name,Age\nJohn,25\nJane,30\n",
+    "empty_rows": "Name,Age,City\nJohn,25,New York\n,,,\nJane,30,Los Angeles\n\nBob,35,Chicago\n",
+    "uneven_rows": "Name,Age,City,Country\nJohn,25,New York\nJane,30,Los Angeles,USA,Extra\nBob,35,Chicago,USA\n",
+    "empty_headers": "Name,,City\nJohn,25,New York\nJane,30,Los Angeles\n",
+    "extra_columns": "Name,Age\nJohn,25,Extra1\nJane,30\nBob,35,Extra2,Extra3\n",
+    "short_rows": "Name,Age,City,Country\nJohn,25\nJane,30,Los Angeles\nBob,35,Chicago,USA\n",
+    "people_50": "Name,Age\n" + "".join(f"Person{i},{20 + i}\n" for i in range(50)),
+    "people_100": "Name,Age\n" + "".join(f"Person{i},{20 + i}\n" for i in range(100)),
+    "large_100": "ID,Name,Value\n" + "".join(f"{i},Person{i},{i * 10}\n" for i in range(100)),
+    "large_1000": "ID,Name,Value\n" + "".join(f"{i},Person{i},{i * 10}\n" for i in range(1000)),
+}
+
+
+@pytest.fixture(scope="session")
+def csv_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """
+    Write each CSV payload used by the tests once per session.
+
+    Returns a mapping of payload name to file path for DsvHelper.parse_stream.
+    """
+    directory = tmp_path_factory.mktemp("csv")
+    paths: dict[str, str] = {}
+    for name, text in CSV_PAYLOADS.items():
+        # Bytes are written in one call with "\n" line endings on every platform
+        path = directory / f"{name}.csv"
+        path.write_bytes(text.encode("utf-8"))
+        paths[name] = str(path)
+    return paths
+
+
+def _stream_from_rows(
+    rows: list[list[str]],
+    chunk_size: int = DEFAULT_TEST_CHUNK
+) -> Iterator[list[list[str]]]:
+    """Yield rows in chunks, as DsvHelper.parse_stream does, without a file or the DSV parser."""
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+
+def _make_stream(
+    text: str,
+    chunk_size: int = DEFAULT_TEST_CHUNK
+) -> Iterator[list[list[str]]]:
+    """Parse CSV text through DsvHelper.parse_stream from memory rather than a file."""
+    return DsvHelper.parse_stream(io.StringIO(text), ",", chunk_size=chunk_size)
+
+
+# Scaffold-identical cases: (test id, csv_files payload, header_rows, columns after init, rows as (name, value) pairs)
+BASIC_CASES: list[tuple[str, str, int, list[str], list[tuple[tuple[str, str], ...]]]] = [
+    (
+        "with_headers", "headers", 1,
+        ["Name", "Age", "City"],
+        [
+            (("Name", "John"), ("Age", "25"), ("City", "New York")),
+            (("Name", "Jane"), ("Age", "30"), ("City", "Los Angeles")),
+            (("Name", "Bob"), ("Age", "35"), ("City", "Chicago")),
+        ],
+    ),
+    (
+        "without_headers", "no_headers", 0,
+        ["column_0", "column_1", "column_2"],
+        [
+            (("column_0", "John"), ("column_1", "25"), ("column_2", "New York")),
+            (("column_0", "Jane"), ("column_1", "30"), ("column_2", "Los Angeles")),
+            (("column_0", "Bob"), ("column_1", "35"), ("column_2", "Chicago")),
+        ],
+    ),
+    (
+        "multi_row_headers", "multi_row_headers", 2,
+        ["Personal_Name", "Personal_Age", "Location_City"],
+        [
+            (("Personal_Name", "John"), ("Personal_Age", "25"), ("Location_City", "New York")),
+            (("Personal_Name", "Jane"), ("Personal_Age", "30"), ("Location_City", "Los Angeles")),
+        ],
+    ),
+    (
+        "empty_file", "header_only", 1,
+        ["Name", "Age"],
+        [],
+    ),
+    (
+        "skip_empty_rows", "empty_rows", 1,
+        ["Name", "Age", "City"],
+        [
+            (("Name", "John"), ("Age", "25"), ("City", "New York")),
+            (("Name", "Jane"), ("Age", "30"), ("City", "Los Angeles")),
+            (("Name", "Bob"), ("Age", "35"), ("City", "Chicago")),
+        ],
+    ),
+    (
+        "empty_headers", "empty_headers", 1,
+        ["Name", "column_1", "City"],
+        [
+            (("Name", "John"), ("column_1", "25"), ("City", "New York")),
+            (("Name", "Jane"), ("column_1", "30"), ("City", "Los Angeles")),
+        ],
+    ),
+    (
+        "row_padding", "short_rows", 1,
+        ["Name", "Age", "City", "Country"],
+        [
+            (("Name", "John"), ("Age", "25"), ("City", ""), ("Country", "")),
+            (("Name", "Jane"), ("Age", "30"), ("City", "Los Angeles"), ("Country", "")),
+            (("Name", "Bob"), ("Age", "35"), ("City", "Chicago"), ("Country", "USA")),
+        ],
+    ),
+    (
+        "uneven_rows", "uneven_rows", 1,
+        ["Name", "Age", "City", "Country"],
+        [
+            (("Name", "John"), ("Age", "25"), ("City", "New York"), ("Country", "")),
+            (("Name", "Jane"), ("Age", "30"), ("City", "Los Angeles"), ("Country", "USA"), ("column_4", "Extra")),
+            (("Name", "Bob"), ("Age", "35"), ("City", "Chicago"), ("Country", "USA"), ("column_4", "")),
+        ],
+    ),
+    (
+        "dynamic_column_expansion", "extra_columns", 1,
+        ["Name", "Age"],
+        [
+            (("Name", "John"), ("Age", "25"), ("column_2", "Extra1")),
+            (("Name", "Jane"), ("Age", "30"), ("column_2", "")),
+            (("Name", "Bob"), ("Age", "35"), ("column_2", "Extra2"), ("column_3", "Extra3")),
+        ],
+    ),
+]
 
-            # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-            assert rows[0] == {"Name": "John", "Age": "25", "City": "New York"}
-            assert rows[1] == {"Name": "Jane", "Age": "30", "City": "Los Angeles"}
-            assert rows[2] == {"Name": "Bob", "Age": "35", "City": "Chicago"}
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_without_headers(self) -> None:
-        """Test StreamingTabularDataModel without header rows."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            f.write("Bob,35,Chicago\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=0,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test column names (auto-generated)
-            assert model.column_names == ["column_0", "column_1", "column_2"]
-            assert model.column_count == 3
 
-            # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-            assert rows[0] == {"column_0": "John", "column_1": "25", "column_2": "New York"}
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_with_multi_row_headers(self) -> None:
-        """Test StreamingTabularDataModel with multi-row headers."""
-        # Create a temporary CSV file with multi-row headers
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Personal,Personal,Location\n")
-            f.write("Name,Age,City\n")
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=2,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test column names (merged)
-            assert model.column_names == ["Personal_Name", "Personal_Age", "Location_City"]
-            assert model.column_count == 3
+class TestStreamingTabularDataModel:
+    """Test cases for StreamingTabularDataModel."""
 
-            # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 2
-            assert rows[0] == {"Personal_Name": "John", "Personal_Age": "25", "Location_City": "New York"}
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+    @pytest.mark.parametrize(
+        ("payload", "header_rows", "expected_columns", "expected_rows"),
+        [case[1:] for case in BASIC_CASES],
+        ids=[case[0] for case in BASIC_CASES]
+    )
+    def test_streaming_basic(
+        self,
+        csv_files: dict[str, str],
+        payload: str,
+        header_rows: int,
+        expected_columns: list[str],
+        expected_rows: list[tuple[tuple[str, str], ...]]
+    ) -> None:
+        """Test column names and rows produced for each basic CSV layout."""
+        stream = DsvHelper.parse_stream(csv_files[payload], ",", chunk_size=DEFAULT_TEST_CHUNK)
+        with StreamingTabularDataModel(
+            stream,
+            header_rows=header_rows,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        ) as model:
+            # Test column names and index before iteration
+            assert model.column_names == expected_columns
+            assert model.column_count == len(expected_columns)
+            for index, name in enumerate(expected_columns):
+                assert model.column_index(name) == index
+
+            # Test iteration; rows wider than the header add column_<index> names, and comparing
+            # (name, value) pairs in order points a failure at the first differing row
+            rows = model.iter_rows()
+            for expected_row in expected_rows:
+                assert tuple(next(rows).items()) == expected_row
+            assert next(rows, None) is None
+            if expected_rows:
+                assert model.column_names == [name for name, _ in expected_rows[-1]]
 
     def test_streaming_model_buffer_operations(self) -> None:
         """Test StreamingTabularDataModel buffer operations."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            for i in range(10):
-                f.write(f"Person{i},{20 + i}\n")
-            temp_file = f.name
-            # Ensure file is closed before opening for reading
-            f.close()
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-
-            # Create streaming model with small buffer
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test clearing buffer
-            model.clear_buffer()
-            assert len(model._buffer) == 0
-
-            # Exhaust the iterator to ensure file is closed
-            list(model.iter_rows())
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_empty_file(self) -> None:
-        """Test StreamingTabularDataModel with empty file."""
-        # Create a temporary empty CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test with no data rows
-            assert model.column_names == ["Name", "Age"]
-            rows = list(model.iter_rows())
-            assert len(rows) == 0
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+        rows = [["Name", "Age"]] + [[f"Person{i}", str(20 + i)] for i in range(10)]
+
+        # Create streaming model with small buffer
+        model = StreamingTabularDataModel(
+            _stream_from_rows(rows),
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=100
+        )
+        assert len(model._buffer) == 10
+
+        # Test clearing buffer
+        model.clear_buffer()
+        assert len(model._buffer) == 0
+
+    def test_streaming_model_close(self, csv_files: dict[str, str]) -> None:
+        """Test close releases the stream part-way through."""
+        # 101 lines at chunk_size=100 leaves a second chunk unread after initialization
+        stream = DsvHelper.parse_stream(csv_files["people_100"], ",", chunk_size=100)
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=100
+        )
+
+        model.close()
+        assert list(model) == []
+        assert list(stream) == []
+
+        # Streams without close() are accepted
+        model = StreamingTabularDataModel(iter([[["Name"], ["John"]]]), header_rows=1)
+        model.close()
+        assert list(model) == []
+
+        # Leaving a with block closes the stream, even part-way through
+        stream = DsvHelper.parse_stream(csv_files["people_100"], ",", chunk_size=100)
+        with StreamingTabularDataModel(stream, header_rows=1, chunk_size=100) as model:
+            assert next(iter(model)) == ["Person0", "20"]
+        assert list(stream) == []
+
+    def test_streaming_model_supplied_column_names(self, csv_files: dict[str, str]) -> None:
+        """Test column names supplied up front instead of derived from the stream."""
+        column_names = ["Name", "Age", "City"]
+        model = StreamingTabularDataModel(
+            DsvHelper.parse_stream(csv_files["no_headers_two_rows"], ",", chunk_size=DEFAULT_TEST_CHUNK),
+            header_rows=0,
+            chunk_size=DEFAULT_TEST_CHUNK,
+            column_names=column_names
+        )
+
+        assert model.column_names == column_names
+        assert model.column_index("City") == 2
+        assert list(model.iter_rows()) == [
+            {"Name": "John", "Age": "25", "City": "New York"},
+            {"Name": "Jane", "Age": "30", "City": "Los Angeles"},
+        ]
+
+        # The same names are applied again after a reset
+        model.reset_stream(DsvHelper.parse_stream(csv_files["no_headers"], ",", chunk_size=DEFAULT_TEST_CHUNK))
+        assert model.column_names == column_names
+        assert sum(1 for _ in model) == 3
+
+        # Wider rows extend the model's names, never the caller's list
+        narrow_names = ["Name", "Age"]
+        model = StreamingTabularDataModel(
+            DsvHelper.parse_stream(csv_files["no_headers"], ",", chunk_size=DEFAULT_TEST_CHUNK),
+            header_rows=0,
+            chunk_size=DEFAULT_TEST_CHUNK,
+            column_names=narrow_names
+        )
+        list(model)
+        assert model.column_names == ["Name", "Age", "column_2"]
+        assert narrow_names == ["Name", "Age"]
+
+        # With header rows, the header is consumed but the supplied names are used as-is
+        model = StreamingTabularDataModel(
+            _make_stream(CSV_PAYLOADS["headers"]),
+            header_rows=1,
+            chunk_size=DEFAULT_TEST_CHUNK,
+            column_names=["name", "age", "city"]
+        )
+        assert model.column_names == ["name", "age", "city"]
+        rows = model.iter_rows()
+        assert next(rows) == {"name": "John", "age": "25", "city": "New York"}
+        assert sum(1 for _ in rows) == 2
 
     def test_streaming_model_invalid_parameters(self) -> None:
         """Test StreamingTabularDataModel with invalid parameters."""
@@ -230,246 +295,102 @@ class TestStreamingTabularDataModel:
         with pytest.raises(ValueError, match="chunk_size must be at least 100"):
             StreamingTabularDataModel(iter([]), chunk_size=50)
 
-    def test_streaming_model_large_dataset(self) -> None:
-        """Test StreamingTabularDataModel with large dataset."""
-        # Create a temporary CSV file with many rows
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("ID,Name,Value\n")
-            for i in range(1000):
-                f.write(f"{i},Person{i},{i * 10}\n")
-            temp_file = f.name
-            f.close()
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model with small buffer
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=1000  # Small buffer to test memory efficiency
-            )
-
-            # Test that we can iterate through all rows
-            row_count = 0
-            for row in model.iter_rows():
-                assert "ID" in row
-                assert "Name" in row
-                assert "Value" in row
-                row_count += 1
-
-            assert row_count == 1000
-
-            # Test that buffer is empty after iteration (streaming behavior)
-            assert len(model._buffer) == 0
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+    def test_streaming_model_large_dataset(self, csv_files: dict[str, str]) -> None:
+        """Test StreamingTabularDataModel with a 100-row dataset."""
+        # Create stream from DsvHelper
+        stream = DsvHelper.parse_stream(csv_files["large_100"], ",", chunk_size=DEFAULT_TEST_CHUNK)
+
+        # Create streaming model with the minimum buffer
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=100
+        )
+
+        # Test that we can iterate through all rows; tuples avoid building a dict per row
+        assert model.column_names == ["ID", "Name", "Value"]
+        rows = list(model.iter_rows_as_tuples())
+        assert len(rows) == 100
+        assert all(len(row) == 3 for row in rows)
+        assert rows[0] == ("0", "Person0", "0")
+        assert rows[-1] == ("99", "Person99", "990")
+
+        # Test that buffer is empty after iteration (streaming behavior)
+        assert len(model._buffer) == 0
+
+    @pytest.mark.slow
+    def test_streaming_model_large_dataset_throughput(self, csv_files: dict[str, str]) -> None:
+        """Test StreamingTabularDataModel streams a 1000-row dataset end to end."""
+        # Create stream from DsvHelper
+        stream = DsvHelper.parse_stream(csv_files["large_1000"], ",", chunk_size=DEFAULT_TEST_CHUNK)
+
+        # Create streaming model with small buffer
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=1000  # Small buffer to test memory efficiency
+        )
+
+        # Test that we can iterate through all rows; tuples avoid building a dict per row
+        assert model.column_names == ["ID", "Name", "Value"]
+        rows = list(model.iter_rows_as_tuples())
+        assert len(rows) == 1000
+        assert all(len(row) == 3 for row in rows)
+        # Spot-check the first, middle and last rows rather than all 1000
+        assert rows[0] == ("0", "Person0", "0")
+        assert rows[500] == ("500", "Person500", "5000")
+        assert rows[-1] == ("999", "Person999", "9990")
+
+        # Test that buffer is empty after iteration (streaming behavior)
+        assert len(model._buffer) == 0
 
     def test_streaming_model_invalid_column_operations(self) -> None:
         """Test error handling for invalid column operations."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            f.write("John,25\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test invalid column name for column_index
-            with pytest.raises(ValueError, match="Column name InvalidColumn not found"):
-                model.column_index("InvalidColumn")
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+        # Create streaming model
+        model = StreamingTabularDataModel(
+            _stream_from_rows([["Name", "Age"], ["John", "25"]]),
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        )
+
+        # Test invalid column name for column_index
+        with pytest.raises(ValueError, match="Column name InvalidColumn not found"):
+            model.column_index("InvalidColumn")
 
     def test_streaming_model_iteration_methods(self) -> None:
         """Test different iteration methods."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age,City\n")
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test basic iteration
-            rows = list(model)
-            assert len(rows) == 2
-            assert rows[0] == ["John", "25", "New York"]
-            assert rows[1] == ["Jane", "30", "Los Angeles"]
-
-            # Create new model for dictionary iteration (since iterator is exhausted)
-            stream2 = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            model2 = StreamingTabularDataModel(
-                stream2,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test dictionary iteration
-            dict_rows = list(model2.iter_rows())
-            assert len(dict_rows) == 2
-            assert dict_rows[0] == {"Name": "John", "Age": "25", "City": "New York"}
-            assert dict_rows[1] == {"Name": "Jane", "Age": "30", "City": "Los Angeles"}
-
-            # Create new model for tuple iteration
-            stream3 = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            model3 = StreamingTabularDataModel(
-                stream3,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test tuple iteration
-            tuple_rows = list(model3.iter_rows_as_tuples())
-            assert len(tuple_rows) == 2
-            assert tuple_rows[0] == ("John", "25", "New York")
-            assert tuple_rows[1] == ("Jane", "30", "Los Angeles")
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-                if 'model2' in locals():
-                    list(getattr(model2, 'iter_rows', lambda: [])())
-                if 'model3' in locals():
-                    list(getattr(model3, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_skip_empty_rows(self) -> None:
-        """Test StreamingTabularDataModel with empty rows."""
-        # Create a temporary CSV file with empty rows
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age,City\n")
-            f.write("John,25,New York\n")
-            f.write(",,,\n")  # Empty row
-            f.write("Jane,30,Los Angeles\n")
-            f.write("\n")  # Another empty row
-            f.write("Bob,35,Chicago\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model with skip_empty_rows=True
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that empty rows are skipped
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-            assert rows[0]["Name"] == "John"
-            assert rows[1]["Name"] == "Jane"
-            assert rows[2]["Name"] == "Bob"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_uneven_rows(self) -> None:
-        """Test StreamingTabularDataModel with uneven row lengths."""
-        # Create a temporary CSV file with uneven rows
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age,City,Country\n")
-            f.write("John,25,New York\n")  # Missing Country
-            f.write("Jane,30,Los Angeles,USA,Extra\n")  # Extra column
-            f.write("Bob,35,Chicago,USA\n")  # Complete row
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that rows are properly padded/truncated
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-            
-            # First row should be padded with empty strings
-            assert rows[0]["Name"] == "John"
-            assert rows[0]["Age"] == "25"
-            assert rows[0]["City"] == "New York"
-            assert rows[0]["Country"] == ""
-            
-            # Second row should have extra columns added
-            assert rows[1]["Name"] == "Jane"
-            assert rows[1]["Age"] == "30"
-            assert rows[1]["City"] == "Los Angeles"
-            assert rows[1]["Country"] == "USA"
-            assert rows[1]["column_4"] == "Extra"
-            
-            # Third row should be complete
-            assert rows[2]["Name"] == "Bob"
-            assert rows[2]["Age"] == "35"
-            assert rows[2]["City"] == "Chicago"
-            assert rows[2]["Country"] == "USA"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+        data = [["Name", "Age", "City"], ["John", "25", "New York"], ["Jane", "30", "Los Angeles"]]
+
+        # Create streaming model
+        model = StreamingTabularDataModel(
+            _stream_from_rows(data),
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        )
+
+        # Test basic iteration; next() checks each row and the end of the stream in one pass
+        rows = iter(model)
+        assert next(rows) == ["John", "25", "New York"]
+        assert next(rows) == ["Jane", "30", "Los Angeles"]
+        assert next(rows, None) is None
+
+        # Reuse the model for dictionary iteration with a fresh stream (the first one is exhausted)
+        model.reset_stream(_stream_from_rows(data))
+        dict_rows = model.iter_rows()
+        assert tuple(next(dict_rows).items()) == (("Name", "John"), ("Age", "25"), ("City", "New York"))
+        assert tuple(next(dict_rows).items()) == (("Name", "Jane"), ("Age", "30"), ("City", "Los Angeles"))
+        assert next(dict_rows, None) is None
+
+        # Reuse it again for tuple iteration
+        model.reset_stream(_stream_from_rows(data))
+        tuple_rows = model.iter_rows_as_tuples()
+        assert next(tuple_rows) == ("John", "25", "New York")
+        assert next(tuple_rows) == ("Jane", "30", "Los Angeles")
+        assert next(tuple_rows, None) is None
 
     def test_streaming_model_header_validation(self) -> None:
         """Test header validation."""
@@ -477,417 +398,164 @@ class TestStreamingTabularDataModel:
         with pytest.raises(ValueError, match="Header rows must be greater than or equal to 0"):
             StreamingTabularDataModel(iter([]), header_rows=-1)
 
-    def test_streaming_model_empty_headers(self) -> None:
-        """Test StreamingTabularDataModel with empty headers."""
-        # Create a temporary CSV file with empty headers
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,,City\n")  # Empty middle header
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that empty headers are replaced with column_<index>
-            assert model.column_names == ["Name", "column_1", "City"]
-            assert model.column_count == 3
-
-            # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 2
-            assert rows[0]["Name"] == "John"
-            assert rows[0]["column_1"] == "25"
-            assert rows[0]["City"] == "New York"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_reset_stream(self) -> None:
+    def test_streaming_model_reset_stream(self, csv_files: dict[str, str]) -> None:
         """Test resetting the stream."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            f.write("John,25\n")
-            f.write("Jane,30\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test initial state
-            assert model.column_names == ["Name", "Age"]
-            assert model._is_initialized is True
-
-            # Reset stream
-            model.reset_stream()
-            assert model._is_initialized is False
-            assert len(model._buffer) == 0
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_buffer_size_limits(self) -> None:
+        # Create stream from DsvHelper
+        stream = DsvHelper.parse_stream(csv_files["name_age_two_rows"], ",", chunk_size=DEFAULT_TEST_CHUNK)
+        
+        # Create streaming model
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        )
+
+        # Test initial state
+        assert model.column_names == ["Name", "Age"]
+        assert model._is_initialized is True
+
+        # Reset stream
+        model.reset_stream()
+        assert model._is_initialized is False
+        assert len(model._buffer) == 0
+
+        # Reset onto a new stream re-reads its headers, dropping columns added by the previous one
+        model.reset_stream(DsvHelper.parse_stream(csv_files["extra_columns"], ",", chunk_size=DEFAULT_TEST_CHUNK))
+        assert model._is_initialized is True
+        assert list(model) == [["John", "25", "Extra1"], ["Jane", "30", ""], ["Bob", "35", "Extra2", "Extra3"]]
+        assert model.column_names == ["Name", "Age", "column_2", "column_3"]
+
+        model.reset_stream(DsvHelper.parse_stream(csv_files["name_age_two_rows"], ",", chunk_size=DEFAULT_TEST_CHUNK))
+        assert model.column_names == ["Name", "Age"]
+        assert model.column_index("Age") == 1
+        assert list(model) == [["John", "25"], ["Jane", "30"]]
+
+    def test_streaming_model_buffer_size_limits(self, csv_files: dict[str, str]) -> None:
         """Test buffer size limits."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            for i in range(50):
-                f.write(f"Person{i},{20 + i}\n")
-            temp_file = f.name
-            f.close()
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model with small buffer (minimum allowed)
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100  # Minimum allowed
-            )
-
-            # Test that we can still iterate through all rows
-            row_count = 0
-            for row in model.iter_rows():
-                assert "Name" in row
-                assert "Age" in row
-                row_count += 1
-
-            assert row_count == 50
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_chunk_processing(self) -> None:
+        # Create stream from DsvHelper
+        stream = DsvHelper.parse_stream(csv_files["people_50"], ",", chunk_size=100)
+        
+        # Create streaming model with small buffer (minimum allowed)
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=100  # Minimum allowed
+        )
+
+        # Test that we can still iterate through all rows
+        assert model.column_names == ["Name", "Age"]
+        # Count rows by width in one lazy pass
+        assert Counter(len(row) for row in model.iter_rows_as_tuples()) == {2: 50}
+
+    def test_streaming_model_chunk_processing(self, csv_files: dict[str, str]) -> None:
         """Test processing of data in chunks."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            for i in range(100):
-                f.write(f"Person{i},{20 + i}\n")
-            temp_file = f.name
-            f.close()
-
-        try:
-            # Create stream from DsvHelper with minimum chunk size
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that we can iterate through all rows
-            row_count = 0
-            for row in model.iter_rows():
-                assert "Name" in row
-                assert "Age" in row
-                row_count += 1
-
-            assert row_count == 100
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
+        # Create stream from DsvHelper with minimum chunk size
+        stream = DsvHelper.parse_stream(csv_files["people_100"], ",", chunk_size=100)
+        
+        # Create streaming model
+        model = StreamingTabularDataModel(
+            stream,
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=100
+        )
+
+        # Test that we can iterate through all rows
+        assert model.column_names == ["Name", "Age"]
+        # Count rows by width in one lazy pass
+        assert Counter(len(row) for row in model.iter_rows_as_tuples()) == {2: 100}
 
     def test_streaming_model_initialization_early_return(self) -> None:
         """Test that initialization returns early if already initialized."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            f.write("John,25\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that initialization is marked as complete
-            assert model._is_initialized is True
-
-            # Call initialization again - should return early
-            model._initialize_from_stream()
-            assert model._is_initialized is True
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_process_headers_edge_cases(self) -> None:
+        # Create streaming model
+        model = StreamingTabularDataModel(
+            _stream_from_rows([["Name", "Age"], ["John", "25"]]),
+            header_rows=1,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        )
+
+        # Test that initialization is marked as complete
+        assert model._is_initialized is True
+
+        # Call initialization again - should return early
+        model._initialize_from_stream()
+        assert model._is_initialized is True
+
+    @pytest.mark.parametrize(
+        ("header_data", "header_rows", "expected"),
+        [
+            # Empty data
+            ([], 0, ([], [])),
+            # Empty column names
+            ([["", "", ""]], 1, ([["", "", ""]], ["column_0", "column_1", "column_2"])),
+            # Mixed empty and non-empty names
+            ([["Name", "", "City"]], 1, ([["Name", "", "City"]], ["Name", "column_1", "City"])),
+            # Column count padding: the second row has more columns
+            (
+                [["Name", "Age"], ["John", "25", "Extra"]], 2,
+                ([["Name_John", "Age_25", "Extra"]], ["Name_John", "Age_25", "Extra"]),
+            ),
+            # Single empty row
+            ([[""]], 1, ([[""]], ["column_0"])),
+            # Multiple empty rows
+            ([[""], [""], [""]], 3, ([[""]], ["column_0"])),
+        ],
+        ids=["empty", "all_empty_names", "some_empty_names", "padding", "single_empty_row", "multiple_empty_rows"]
+    )
+    def test_streaming_model_process_headers_edge_cases(
+        self,
+        header_data: list[list[str]],
+        header_rows: int,
+        expected: tuple[list[list[str]], list[str]]
+    ) -> None:
         """Test process_headers with various edge cases."""
-        # Test with empty data
-        result = StreamingTabularDataModel.process_headers([], header_rows=0)
-        assert result == ([], [])
-        
-        # Test with empty column names
-        header_data = [["", "", ""]]
-        result = StreamingTabularDataModel.process_headers(header_data, header_rows=1)
-        assert result[1] == ["column_0", "column_1", "column_2"]
-        
-        # Test with mixed empty and non-empty names
-        header_data = [["Name", "", "City"]]
-        result = StreamingTabularDataModel.process_headers(header_data, header_rows=1)
-        assert result[1] == ["Name", "column_1", "City"]
-        
-        # Test with column count padding
-        header_data = [["Name", "Age"], ["John", "25", "Extra"]]  # Second row has more columns
-        result = StreamingTabularDataModel.process_headers(header_data, header_rows=2)
-        assert len(result[1]) == 3  # Should have 3 columns based on max row length
-        
-        # Test with single empty row
-        header_data = [[""]]
-        result = StreamingTabularDataModel.process_headers(header_data, header_rows=1)
-        assert result[1] == ["column_0"]
-        
-        # Test with multiple empty rows
-        header_data = [[""], [""], [""]]
-        result = StreamingTabularDataModel.process_headers(header_data, header_rows=3)
-        assert result[1] == ["column_0"]
-
-    def test_streaming_model_dynamic_column_expansion(self) -> None:
-        """Test dynamic column expansion during iteration."""
-        # Create a temporary CSV file with varying column counts
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            f.write("John,25,Extra1\n")  # Extra column
-            f.write("Jane,30\n")  # Normal row
-            f.write("Bob,35,Extra2,Extra3\n")  # More extra columns
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test initial column count
-            assert model.column_count == 2
-            assert model.column_names == ["Name", "Age"]
-
-            # Iterate through rows to trigger dynamic expansion
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-
-            # Check that columns were expanded
-            assert model.column_count >= 4  # At least 4 columns after expansion
-            assert "column_2" in model.column_names
-            assert "column_3" in model.column_names
-
-            # Check row data
-            assert rows[0]["Name"] == "John"
-            assert rows[0]["Age"] == "25"
-            assert rows[0]["column_2"] == "Extra1"
-
-            assert rows[1]["Name"] == "Jane"
-            assert rows[1]["Age"] == "30"
-
-            assert rows[2]["Name"] == "Bob"
-            assert rows[2]["Age"] == "35"
-            assert rows[2]["column_2"] == "Extra2"
-            assert rows[2]["column_3"] == "Extra3"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_row_padding(self) -> None:
-        """Test row padding during iteration."""
-        # Create a temporary CSV file with short rows
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age,City,Country\n")
-            f.write("John,25\n")  # Short row
-            f.write("Jane,30,Los Angeles\n")  # Medium row
-            f.write("Bob,35,Chicago,USA\n")  # Complete row
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test iteration with row padding
-            rows = list(model.iter_rows())
-            assert len(rows) == 3
-
-            # First row should be padded
-            assert rows[0]["Name"] == "John"
-            assert rows[0]["Age"] == "25"
-            assert rows[0]["City"] == ""
-            assert rows[0]["Country"] == ""
-
-            # Second row should be padded
-            assert rows[1]["Name"] == "Jane"
-            assert rows[1]["Age"] == "30"
-            assert rows[1]["City"] == "Los Angeles"
-            assert rows[1]["Country"] == ""
-
-            # Third row should be complete
-            assert rows[2]["Name"] == "Bob"
-            assert rows[2]["Age"] == "35"
-            assert rows[2]["City"] == "Chicago"
-            assert rows[2]["Country"] == "USA"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-    def test_streaming_model_no_headers_with_empty_buffer(self) -> None:
-        """Test no headers case with empty buffer."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("John,25,New York\n")
-            f.write("Jane,30,Los Angeles\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model with no headers
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=0,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
-
-            # Test that column names are auto-generated
-            assert model.column_names == ["column_0", "column_1", "column_2"]
-            assert model.column_count == 3
-
-            # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 2
-            assert rows[0]["column_0"] == "John"
-            assert rows[0]["column_1"] == "25"
-            assert rows[0]["column_2"] == "New York"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file)
-
-
-
-    def test_streaming_model_iteration_with_empty_chunks(self) -> None:
-        """Test iteration with empty chunks in stream."""
-        # Create a temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("Name,Age\n")
-            f.write("John,25\n")
-            f.write("Jane,30\n")
-            temp_file = f.name
-
-        try:
-            # Create stream from DsvHelper
-            stream = DsvHelper.parse_stream(temp_file, ",", chunk_size=100)
-            
-            # Create streaming model
-            model = StreamingTabularDataModel(
-                stream,
-                header_rows=1,
-                skip_empty_rows=True,
-                chunk_size=100
-            )
+        assert StreamingTabularDataModel.process_headers(header_data, header_rows=header_rows) == expected
+
+    @pytest.mark.parametrize(
+        ("payload", "header_rows", "expected_columns", "expected_rows"),
+        [
+            (
+                "no_headers_two_rows", 0,
+                ["column_0", "column_1", "column_2"],
+                [
+                    (("column_0", "John"), ("column_1", "25"), ("column_2", "New York")),
+                    (("column_0", "Jane"), ("column_1", "30"), ("column_2", "Los Angeles")),
+                ],
+            ),
+            (
+                "name_age_two_rows", 1,
+                ["Name", "Age"],
+                [
+                    (("Name", "John"), ("Age", "25")),
+                    (("Name", "Jane"), ("Age", "30")),
+                ],
+            ),
+        ],
+        ids=["no_headers_with_empty_buffer", "iteration_with_empty_chunks"]
+    )
+    def test_streaming_model_in_memory_stream(
+        self,
+        payload: str,
+        header_rows: int,
+        expected_columns: list[str],
+        expected_rows: list[tuple[tuple[str, str], ...]]
+    ) -> None:
+        """Test column names and rows for CSV text parsed from memory."""
+        with StreamingTabularDataModel(
+            _make_stream(CSV_PAYLOADS[payload]),
+            header_rows=header_rows,
+            skip_empty_rows=True,
+            chunk_size=DEFAULT_TEST_CHUNK
+        ) as model:
+            # Column names come from the header rows or are auto-generated without them
+            assert model.column_names == expected_columns
+            assert model.column_count == len(expected_columns)
 
             # Test iteration
-            rows = list(model.iter_rows())
-            assert len(rows) == 2
-            assert rows[0]["Name"] == "John"
-            assert rows[1]["Name"] == "Jane"
-
-        finally:
-            # Ensure all file handles are closed before deletion
-            try:
-                if 'model' in locals():
-                    list(getattr(model, 'iter_rows', lambda: [])())
-            except Exception:
-                pass
-            os.unlink(temp_file) 
\ No newline at end of file
+            rows = model.iter_rows()
+            for expected_row in expected_rows:
+                assert tuple(next(rows).items()) == expected_row
+            assert next(rows, None) is None
@@ -1,8 +1,11 @@
+import io
+import mmap
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
-from splurge_tools.text_file_helper import TextFileHelper
+from splurge_tools.text_file_helper import LineView, TextFileHelper
 
 
 class TestTextFileHelper(unittest.TestCase):
@@ -34,6 +37,17 @@ class TestTextFileHelper(unittest.TestCase):
         self.assertEqual(TextFileHelper.line_count(empty_file.name), 0)
         os.unlink(empty_file.name)
 
+        # Test trailing newline and CRLF line endings
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as newline_file:
+            newline_file.write(b"Line 1\r\nLine 2\r\nLine 3\n")
+        self.assertEqual(TextFileHelper.line_count(newline_file.name), 3)
+
+        # Test counting across several reads
+        with patch.object(TextFileHelper, "_SLAB_SIZE", 4):
+            self.assertEqual(TextFileHelper.line_count(newline_file.name), 3)
+            self.assertEqual(TextFileHelper.line_count(self.temp_file.name), 5)
+        os.unlink(newline_file.name)
+
         # Test file not found
         with self.assertRaises(FileNotFoundError):
             TextFileHelper.line_count("nonexistent_file.txt")
@@ -48,6 +62,38 @@ class TestTextFileHelper(unittest.TestCase):
         )
         os.unlink(encoded_file.name)
 
+        # Test CRLF line endings split across decoded slabs
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as encoded_file:
+            encoded_file.write("Line 1\r\nLine 2\r\nLine 3\r\n".encode("utf-16"))
+        with patch.object(TextFileHelper, "_SLAB_SIZE", 7):
+            self.assertEqual(
+                TextFileHelper.line_count(encoded_file.name, encoding="utf-16"), 3
+            )
+        os.unlink(encoded_file.name)
+
+        # Test counting byte ranges in parallel, with and without a trailing newline
+        with patch.object(TextFileHelper, "_COUNT_RANGE_SIZE", 4), patch.object(os, "cpu_count", return_value=4):
+            self.assertEqual(TextFileHelper.line_count(self.temp_file.name), 5)
+            with tempfile.NamedTemporaryFile(mode="w", delete=False) as range_file:
+                range_file.write("Line 1\nLine 2\nLine 3\n")
+            self.assertEqual(TextFileHelper.line_count(range_file.name), 3)
+            os.unlink(range_file.name)
+
+        # Test lone CR and mixed line endings, counted like a text-mode read
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as cr_file:
+            cr_file.write(b"a\rb\rc\r")
+        self.assertEqual(TextFileHelper.line_count(cr_file.name), 3)
+        with open(cr_file.name, "wb") as mixed_file:
+            mixed_file.write(b"a\rb\r\nc\nd")
+        self.assertEqual(TextFileHelper.line_count(cr_file.name), 4)
+
+        # A "\r\n" split between two reads or two byte ranges counts once
+        with patch.object(TextFileHelper, "_SLAB_SIZE", 4):
+            self.assertEqual(TextFileHelper.line_count(cr_file.name), 4)
+        with patch.object(TextFileHelper, "_COUNT_RANGE_SIZE", 4), patch.object(os, "cpu_count", return_value=2):
+            self.assertEqual(TextFileHelper.line_count(cr_file.name), 4)
+        os.unlink(cr_file.name)
+
     def test_preview(self):
         """Test file preview functionality"""
         # Test normal case with default parameters
@@ -99,6 +145,15 @@ class TestTextFileHelper(unittest.TestCase):
         self.assertEqual(preview_lines, ["Line 1", "Line 2"])
         os.unlink(encoded_file.name)
 
+        # Test CRLF line endings with a trailing newline
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as crlf_file:
+            crlf_file.write(b"Header\r\n  Line 1  \r\nLine 2\r\n")
+        preview_lines = TextFileHelper.preview(crlf_file.name, strip=False, skip_header_rows=1)
+        self.assertEqual(preview_lines, ["  Line 1  ", "Line 2"])
+        preview_lines = TextFileHelper.preview(crlf_file.name, max_lines=1, skip_header_rows=1)
+        self.assertEqual(preview_lines, ["Line 1"])
+        os.unlink(crlf_file.name)
+
         # Test invalid max_lines
         with self.assertRaises(ValueError):
             TextFileHelper.preview(self.temp_file.name, max_lines=0)
@@ -152,6 +207,25 @@ class TestTextFileHelper(unittest.TestCase):
         self.assertEqual(TextFileHelper.load(empty_file.name), [])
         os.unlink(empty_file.name)
 
+        # Test the memory mapped and streamed read strategies
+        for threshold in ("_LOAD_MMAP_MIN", "_LOAD_STREAM_MIN"):
+            with patch.object(TextFileHelper, threshold, 1):
+                loaded_lines = TextFileHelper.load(
+                    self.temp_file.name, skip_header_rows=1, skip_footer_rows=1
+                )
+                self.assertEqual(loaded_lines, ["Line 2", "Line 3", "Line 4 with spaces"])
+
+        # Test that every read strategy splits mixed line endings the same way
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as mixed_file:
+            mixed_file.write(b"h\ra\r\nb\rc\nd\r\r\nf\r")
+        for mmap_min, stream_min in ((1 << 30, 1 << 30), (1, 1 << 30), (1, 1)):
+            with patch.object(TextFileHelper, "_LOAD_MMAP_MIN", mmap_min), \
+                    patch.object(TextFileHelper, "_LOAD_STREAM_MIN", stream_min), \
+                    patch.object(TextFileHelper, "_SLAB_SIZE", 4):
+                loaded_lines = TextFileHelper.load(mixed_file.name, skip_header_rows=1, skip_footer_rows=1)
+                self.assertEqual(loaded_lines, ["a", "b", "c", "d", ""])
+        os.unlink(mixed_file.name)
+
         # Test file not found
         with self.assertRaises(FileNotFoundError):
             TextFileHelper.load("nonexistent_file.txt")
@@ -200,6 +274,7 @@ class TestTextFileHelper(unittest.TestCase):
             self.assertEqual(len(chunks), 3)  # 1400 lines / 500 = 3 chunks
             self.assertEqual(chunks[0][0], "Line 1")
             self.assertEqual(chunks[2][399], "Line 1400")
+            self.assertEqual(sum(len(chunk) for chunk in chunks), 1400)
 
             # Test with both skip_header_rows and skip_footer_rows
             chunks = list(TextFileHelper.load_as_stream(
@@ -220,6 +295,14 @@ class TestTextFileHelper(unittest.TestCase):
                 chunks = list(TextFileHelper.load_as_stream(encoded_file_path, encoding="utf-16", chunk_size=100))
                 self.assertEqual(len(chunks), 1)
                 self.assertEqual(chunks[0], ["Line 1", "Line 2", "Line 3"])
+
+                chunks = list(TextFileHelper.load_as_stream(
+                    encoded_file_path,
+                    encoding="utf-16",
+                    skip_footer_rows=1,
+                    chunk_size=100
+                ))
+                self.assertEqual(chunks, [["Line 1", "Line 2"]])
             finally:
                 os.unlink(encoded_file_path)
 
@@ -258,6 +341,43 @@ class TestTextFileHelper(unittest.TestCase):
         finally:
             os.unlink(large_file_path)
 
+    def test_iter_lines(self):
+        """Test line-by-line iteration"""
+        # Test normal case with default parameters (strip=True)
+        lines = list(TextFileHelper.iter_lines(self.temp_file.name))
+        self.assertEqual(lines, ["Line 1", "Line 2", "Line 3", "Line 4 with spaces", "Line 5"])
+
+        # Test with strip=False and header/footer skipping
+        lines = list(TextFileHelper.iter_lines(
+            self.temp_file.name, strip=False, skip_header_rows=2, skip_footer_rows=1
+        ))
+        self.assertEqual(lines, ["Line 3", "  Line 4 with spaces  "])
+
+        # Test with skip rows covering the whole file
+        self.assertEqual(list(TextFileHelper.iter_lines(self.temp_file.name, skip_footer_rows=5)), [])
+        self.assertEqual(list(TextFileHelper.iter_lines(self.temp_file.name, skip_header_rows=5)), [])
+
+        # Test text stream path with lines held back across blocks
+        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-16", delete=False) as encoded_file:
+            encoded_file.write("\n".join(f"Line {i}" for i in range(1, 21)))
+        with patch.object(TextFileHelper, "_SLAB_SIZE", 8):
+            lines = list(TextFileHelper.iter_lines(
+                encoded_file.name, encoding="utf-16", skip_header_rows=1, skip_footer_rows=3
+            ))
+        self.assertEqual(lines, [f"Line {i}" for i in range(2, 18)])
+
+        # Test header rows spanning several slabs, ending inside a slab and past the file
+        with patch.object(TextFileHelper, "_SLAB_SIZE", 8):
+            lines = list(TextFileHelper.iter_lines(encoded_file.name, encoding="utf-16", skip_header_rows=13))
+            self.assertEqual(lines, [f"Line {i}" for i in range(14, 21)])
+            lines = list(TextFileHelper.iter_lines(encoded_file.name, encoding="utf-16", skip_header_rows=20))
+            self.assertEqual(lines, [])
+        os.unlink(encoded_file.name)
+
+        # Test file not found
+        with self.assertRaises(FileNotFoundError):
+            list(TextFileHelper.iter_lines("nonexistent_file.txt"))
+
     def test_load_as_stream_edge_cases(self):
         """Test edge cases for streaming file loading"""
         # Test file with exactly chunk_size lines
@@ -315,6 +435,269 @@ class TestTextFileHelper(unittest.TestCase):
         finally:
             os.unlink(whitespace_file_path)
 
+        # Test CRLF line endings
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as crlf_file:
+            crlf_file.write(b"  Line 1  \r\nLine 2\r\nLine 3\r\n")
+            crlf_file_path = crlf_file.name
+
+        try:
+            chunks = list(TextFileHelper.load_as_stream(crlf_file_path, strip=False, chunk_size=100))
+            self.assertEqual(chunks, [["  Line 1  ", "Line 2", "Line 3"]])
+
+            chunks = list(TextFileHelper.load_as_stream(crlf_file_path, skip_footer_rows=1, chunk_size=100))
+            self.assertEqual(chunks, [["Line 1", "Line 2"]])
+        finally:
+            os.unlink(crlf_file_path)
+
+        # Test lone CR and mixed line endings with header and footer skipping
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as cr_file:
+            cr_file.write(b"a\rb\rc\r\nd\ne\r")
+            cr_file_path = cr_file.name
+
+        try:
+            chunks = list(TextFileHelper.load_as_stream(cr_file_path, skip_header_rows=1, chunk_size=100))
+            self.assertEqual(chunks, [["b", "c", "d", "e"]])
+            self.assertEqual(TextFileHelper.load(cr_file_path, skip_header_rows=1), ["b", "c", "d", "e"])
+
+            chunks = list(TextFileHelper.load_as_stream(
+                cr_file_path,
+                skip_header_rows=2,
+                skip_footer_rows=2,
+                chunk_size=100
+            ))
+            self.assertEqual(chunks, [["c"]])
+            self.assertEqual(TextFileHelper.load(cr_file_path, skip_header_rows=2, skip_footer_rows=2), ["c"])
+
+            # Slabs ending between the "\r" and "\n" of a "\r\n" keep the pair together
+            with patch.object(TextFileHelper, "_SLAB_SIZE", 6):
+                chunks = list(TextFileHelper.load_as_stream(cr_file_path, skip_footer_rows=1, chunk_size=100))
+            self.assertEqual(chunks, [["a", "b", "c", "d"]])
+        finally:
+            os.unlink(cr_file_path)
+
+        # Test slab boundaries, including lines longer than a slab
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as slab_file:
+            slab_content = [f"Line {i}" + ("x" * 40 if i % 7 == 0 else "") for i in range(1, 251)]
+            slab_file.write("\n".join(slab_content) + "\n")
+            slab_file_path = slab_file.name
+
+        try:
+            with patch.object(TextFileHelper, "_SLAB_SIZE", 32):
+                chunks = list(TextFileHelper.load_as_stream(
+                    slab_file_path,
+                    skip_header_rows=3,
+                    skip_footer_rows=5,
+                    chunk_size=100
+                ))
+            self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 42])
+            self.assertEqual([line for chunk in chunks for line in chunk], slab_content[3:-5])
+
+            # Slabs holding more than one chunk, with the remainder carried across slabs
+            with patch.object(TextFileHelper, "_SLAB_SIZE", 1500):
+                chunks = list(TextFileHelper.load_as_stream(slab_file_path, chunk_size=100))
+            self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+            self.assertEqual([line for chunk in chunks for line in chunk], slab_content)
+        finally:
+            os.unlink(slab_file_path)
+
+    def test_load_as_stream_text_stream(self):
+        """Test load_as_stream reading an open text stream instead of a path"""
+        content = [f"Line {i}" for i in range(1, 251)]
+        text_stream = io.StringIO("\n".join(content) + "\n")
+
+        chunks = list(TextFileHelper.load_as_stream(
+            text_stream,
+            skip_header_rows=3,
+            skip_footer_rows=5,
+            chunk_size=100
+        ))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 42])
+        self.assertEqual([line for chunk in chunks for line in chunk], content[3:-5])
+
+        # The caller's stream is left open
+        self.assertFalse(text_stream.closed)
+
+        # Reading starts at the current position, with strip applied per line
+        text_stream = io.StringIO("skipped\n  a  \r\nb\n")
+        text_stream.readline()
+        chunks = list(TextFileHelper.load_as_stream(text_stream, strip=False, chunk_size=100))
+        self.assertEqual(chunks, [["  a  \r", "b"]])
+
+    def test_load_dedupe(self):
+        """Test loading a file with equal lines sharing one string object"""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as repeated_file:
+            repeated_file.write("header\nred \nblue\n red\nblue\nfooter\n")
+
+        try:
+            for stream_min in (TextFileHelper._LOAD_STREAM_MIN, 1):
+                with patch.object(TextFileHelper, "_LOAD_STREAM_MIN", stream_min):
+                    loaded_lines = TextFileHelper.load(
+                        repeated_file.name, skip_header_rows=1, skip_footer_rows=1, dedupe=True
+                    )
+                self.assertEqual(loaded_lines, ["red", "blue", "red", "blue"])
+                self.assertIs(loaded_lines[0], loaded_lines[2])
+                self.assertIs(loaded_lines[1], loaded_lines[3])
+
+            loaded_lines = TextFileHelper.load(repeated_file.name, strip=False, dedupe=True)
+            self.assertEqual(loaded_lines, ["header", "red ", "blue", " red", "blue", "footer"])
+            self.assertIs(loaded_lines[2], loaded_lines[4])
+        finally:
+            os.unlink(repeated_file.name)
+
+    def test_load_lazy(self):
+        """Test loading a file as a lazy line view"""
+        with TextFileHelper.load(self.temp_file.name, lazy=True) as view:
+            self.assertIsInstance(view, LineView)
+            self.assertEqual(len(view), 5)
+            self.assertEqual(list(view), TextFileHelper.load(self.temp_file.name))
+            self.assertEqual(view[3], "Line 4 with spaces")
+            self.assertEqual(view[-1], "Line 5")
+            self.assertEqual(view[1:3], ["Line 2", "Line 3"])
+            self.assertEqual(view[::2], ["Line 1", "Line 3", "Line 5"])
+            self.assertIn("Line 2", view)
+            with self.assertRaises(IndexError):
+                view[5]
+
+        # Test skip rows, strip=False, CRLF line endings and batched iteration
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as crlf_file:
+            crlf_file.write(b"Header\r\n  Line 1  \r\nLine 2\r\n\r\nLine 4\r\nFooter")
+        try:
+            expected = ["  Line 1  ", "Line 2", "", "Line 4"]
+            with TextFileHelper.load(
+                crlf_file.name, strip=False, skip_header_rows=1, skip_footer_rows=1, lazy=True
+            ) as view:
+                self.assertEqual([view[index] for index in range(len(view))], expected)
+                with patch.object(LineView, "_BATCH_SIZE", 3):
+                    self.assertEqual(list(view), expected)
+
+            # Test skip rows covering the whole file
+            self.assertEqual(TextFileHelper.load(crlf_file.name, skip_header_rows=6, lazy=True), [])
+        finally:
+            os.unlink(crlf_file.name)
+
+        # Test encodings without single-byte newlines fall back to a list
+        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-16", delete=False) as encoded_file:
+            encoded_file.write("Line 1\nLine 2")
+        self.assertEqual(TextFileHelper.load(encoded_file.name, encoding="utf-16", lazy=True), ["Line 1", "Line 2"])
+        os.unlink(encoded_file.name)
+
+    def test_newline_offsets(self):
+        """Test building the newline offset index of a mapped file"""
+        content = b"Line 1\r\nLine 22\n\nLine 4"
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as offsets_file:
+            offsets_file.write(content)
+
+        try:
+            expected = [index for index, byte in enumerate(content) if byte == ord("\n")]
+            with open(offsets_file.name, "rb") as stream:
+                mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                with mapped:
+                    self.assertEqual(list(TextFileHelper._newline_offsets(mapped)), expected)
+
+                    # Slabs that end in the middle of a line
+                    with patch.object(TextFileHelper, "_SLAB_SIZE", 3):
+                        self.assertEqual(list(TextFileHelper._newline_offsets(mapped)), expected)
+        finally:
+            os.unlink(offsets_file.name)
+
+        # Lone CR terminators are indexed at the "\r", "\r\n" terminators at the "\n"
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as cr_file:
+            cr_file.write(b"a\rb\r\r\nc\r")
+
+        try:
+            with open(cr_file.name, "rb") as stream:
+                mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                with mapped:
+                    self.assertEqual(list(TextFileHelper._newline_offsets(mapped)), [1, 3, 5, 7])
+
+                    # A slab that ends between the "\r" and "\n" of a "\r\n"
+                    with patch.object(TextFileHelper, "_SLAB_SIZE", 5):
+                        self.assertEqual(list(TextFileHelper._newline_offsets(mapped)), [1, 3, 5, 7])
+        finally:
+            os.unlink(cr_file.name)
+
+    def test_line_index_cache(self):
+        """Test line_count and preview with the cached newline index"""
+        TextFileHelper.clear_line_index_cache()
+        try:
+            self.assertEqual(TextFileHelper.line_count(self.temp_file.name, cache_index=True), 5)
+            for skip_header_rows in range(7):
+                for max_lines in (1, 2, 5, 10):
+                    for strip in (True, False):
+                        self.assertEqual(
+                            TextFileHelper.preview(
+                                self.temp_file.name,
+                                max_lines=max_lines,
+                                strip=strip,
+                                skip_header_rows=skip_header_rows,
+                                cache_index=True
+                            ),
+                            TextFileHelper.preview(
+                                self.temp_file.name,
+                                max_lines=max_lines,
+                                strip=strip,
+                                skip_header_rows=skip_header_rows
+                            )
+                        )
+
+            # Test that a changed file is indexed again
+            with open(self.temp_file.name, "w") as changed_file:
+                changed_file.write("Line 1\nLine 2\n")
+            self.assertEqual(TextFileHelper.line_count(self.temp_file.name, cache_index=True), 2)
+            self.assertEqual(
+                TextFileHelper.preview(self.temp_file.name, skip_header_rows=1, cache_index=True),
+                ["Line 2"]
+            )
+
+            # Test lone CR line endings, indexed and loaded lazily like a text-mode read
+            with tempfile.NamedTemporaryFile(mode="wb", delete=False) as cr_file:
+                cr_file.write(b"a\rb\rc\r")
+            try:
+                self.assertEqual(TextFileHelper.line_count(cr_file.name, cache_index=True), 3)
+                self.assertEqual(TextFileHelper.preview(cr_file.name, max_lines=1, cache_index=True), ["a"])
+                self.assertEqual(
+                    TextFileHelper.preview(cr_file.name, max_lines=1, skip_header_rows=1, cache_index=True),
+                    ["b"]
+                )
+                with TextFileHelper.load(cr_file.name, skip_footer_rows=1, lazy=True) as lines:
+                    self.assertEqual(list(lines), ["a", "b"])
+            finally:
+                os.unlink(cr_file.name)
+
+            # Test empty files and eviction beyond the byte budget
+            with tempfile.NamedTemporaryFile(mode="w", delete=False) as empty_file:
+                empty_file.write("")
+            try:
+                self.assertEqual(TextFileHelper.line_count(empty_file.name, cache_index=True), 0)
+                self.assertEqual(TextFileHelper.preview(empty_file.name, cache_index=True), [])
+                TextFileHelper.clear_line_index_cache()
+                with patch.object(TextFileHelper, "_LINE_INDEX_CACHE_MAX_BYTES", 8):
+                    self.assertEqual(TextFileHelper.line_count(self.temp_file.name, cache_index=True), 2)
+                    self.assertEqual(TextFileHelper.line_count(empty_file.name, cache_index=True), 0)
+                self.assertEqual(list(TextFileHelper._line_index_cache), [empty_file.name])
+                self.assertEqual(TextFileHelper._line_index_cache_bytes, 0)
+
+                # Test that a re-indexed file replaces its entry in the byte total
+                TextFileHelper.line_count(self.temp_file.name, cache_index=True)
+                self.assertEqual(TextFileHelper._line_index_cache_bytes, 16)
+                with open(self.temp_file.name, "w") as changed_file:
+                    changed_file.write("Line 1\nLine 2\nLine 3\n")
+                self.assertEqual(TextFileHelper.line_count(self.temp_file.name, cache_index=True), 3)
+                self.assertEqual(TextFileHelper._line_index_cache_bytes, 24)
+
+                # Test eviction beyond the entry budget, and that clearing resets the byte total
+                TextFileHelper.clear_line_index_cache()
+                self.assertEqual(TextFileHelper._line_index_cache_bytes, 0)
+                with patch.object(TextFileHelper, "_LINE_INDEX_CACHE_MAX_ENTRIES", 1):
+                    self.assertEqual(TextFileHelper.line_count(self.temp_file.name, cache_index=True), 3)
+                    self.assertEqual(TextFileHelper.line_count(empty_file.name, cache_index=True), 0)
+                self.assertEqual(list(TextFileHelper._line_index_cache), [empty_file.name])
+                self.assertEqual(TextFileHelper._line_index_cache_bytes, 0)
+            finally:
+                os.unlink(empty_file.name)
+        finally:
+            TextFileHelper.clear_line_index_cache()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,14 +2,25 @@
 Unit tests for type_helper module
 """
 
+import random
 import unittest
+from array import array
+from collections import OrderedDict
 from datetime import date, datetime, time
+from unittest.mock import patch
 
 from splurge_tools.type_helper import (
     DataType,
     String,
+    _infer_string_type_cached,
+    _parse_date_cached,
+    _parse_time_cached,
+    _sample_values,
     is_dict_like,
     is_empty,
+    is_empty_list,
+    is_empty_many,
+    is_empty_str,
     is_iterable,
     is_iterable_not_string,
     is_list_like,
@@ -35,6 +46,8 @@ class TestString(unittest.TestCase):
         # Test with whitespace
         self.assertTrue(String.is_bool_like(" true "))
         self.assertTrue(String.is_bool_like(" false "))
+        self.assertFalse(String.is_bool_like(" true ", trim=False))
+        self.assertFalse(String.is_bool_like("truthy"))
 
         # Test non-boolean values
         self.assertFalse(String.is_bool_like("yes"))
@@ -57,6 +70,8 @@ class TestString(unittest.TestCase):
         # Test with whitespace
         self.assertTrue(String.is_none_like(" none "))
         self.assertTrue(String.is_none_like(" null "))
+        self.assertFalse(String.is_none_like(" null ", trim=False))
+        self.assertFalse(String.is_none_like("nullable"))
 
         # Test non-None values
         self.assertFalse(String.is_none_like(""))
@@ -94,9 +109,15 @@ class TestString(unittest.TestCase):
         # Test string values
         self.assertTrue(String.is_int_like("123"))
         self.assertTrue(String.is_int_like("-123"))
+        self.assertTrue(String.is_int_like("+123"))
 
         # Test with whitespace
         self.assertTrue(String.is_int_like(" 123 "))
+        self.assertFalse(String.is_int_like(" 123 ", trim=False))
+
+        # Test that superscripts, which str.isdigit() accepts, are not integers
+        self.assertFalse(String.is_int_like("\u00b2"))
+        self.assertFalse(String.is_int_like("+"))
 
         # Test non-integer values
         self.assertFalse(String.is_int_like("123.45"))
@@ -138,8 +159,23 @@ class TestString(unittest.TestCase):
         # Test with whitespace
         self.assertTrue(String.is_date_like(" 2023-01-01 "))
 
+        # Test leap days, day-month order and compact values
+        self.assertTrue(String.is_date_like("2024-02-29"))
+        self.assertTrue(String.is_date_like("2000.02.29"))
+        self.assertTrue(String.is_date_like("2023-27-12"))
+        self.assertTrue(String.is_date_like("20230101"))
+        self.assertTrue(String.is_date_like("12312023"))
+
+        # Test non-ASCII decimal digits, which strptime has always accepted
+        self.assertTrue(String.is_date_like("\uff12\uff10\uff12\uff14-01-01"))
+        self.assertTrue(String.is_date_like("\uff12\uff10\uff12\uff140101"))
+
         # Test non-date values
         self.assertFalse(String.is_date_like("2023-13-27"))  # Invalid month
+        self.assertFalse(String.is_date_like("2023-02-29"))  # Not a leap year
+        self.assertFalse(String.is_date_like("1900-02-29"))  # Not a leap year
+        self.assertFalse(String.is_date_like("2023-01/01"))  # Mixed separators
+        self.assertFalse(String.is_date_like("0000-01-01"))  # Year out of range
         self.assertFalse(String.is_date_like("abc"))
         self.assertFalse(String.is_date_like(None))
         self.assertFalse(String.is_date_like([]))
@@ -224,9 +260,17 @@ class TestString(unittest.TestCase):
         test_date = date(2023, 1, 1)
         self.assertEqual(String.to_date(test_date), test_date)
 
+        # Test datetime values are narrowed to a date
+        converted = String.to_date(datetime(2023, 1, 1, 12, 30, 45))
+        self.assertIs(type(converted), date)
+        self.assertEqual(converted, date(2023, 1, 1))
+
         # Test string values
         self.assertEqual(String.to_date("2023-01-01"), date(2023, 1, 1))
         self.assertEqual(String.to_date("2023/01/01"), date(2023, 1, 1))
+        self.assertEqual(String.to_date(" 2023-02-03 "), date(2023, 2, 3))
+        self.assertEqual(String.to_date("2023-13-02"), date(2023, 2, 13))
+        self.assertEqual(String.to_date("\uff12\uff10\uff12\uff14-01-01"), date(2024, 1, 1))
 
         # Test with default
         self.assertIsNone(String.to_date("invalid", default=None))
@@ -297,6 +341,58 @@ class TestString(unittest.TestCase):
         self.assertEqual(String.infer_type("123.45"), DataType.FLOAT)
         self.assertEqual(String.infer_type("true"), DataType.BOOLEAN)
 
+        # Test trimming, empty values and strings that only resemble other types
+        self.assertEqual(String.infer_type("  NULL  "), DataType.NONE)
+        self.assertEqual(String.infer_type("  NULL  ", trim=False), DataType.STRING)
+        self.assertEqual(String.infer_type("   "), DataType.EMPTY)
+        self.assertEqual(String.infer_type(" .5 "), DataType.FLOAT)
+        self.assertEqual(String.infer_type("-42"), DataType.INTEGER)
+        self.assertEqual(String.infer_type("2023-13-13"), DataType.STRING)
+        self.assertEqual(String.infer_type("x2023-01-01"), DataType.STRING)
+        self.assertEqual(String.infer_type("\uff12\uff10\uff12\uff14-01-01"), DataType.DATE)
+        self.assertEqual(String.infer_type("\uff12\uff10\uff12\uff140101"), DataType.DATE)
+        self.assertEqual(String.infer_type("\uff12\uff10\uff12\uff14-01-01T12:30:45"), DataType.DATETIME)
+        self.assertEqual(String.infer_type([]), DataType.STRING)
+
+    def test_infer_type_cache(self):
+        """Test that infer_type caches string results per trim setting"""
+        String.clear_infer_type_cache()
+        self.assertEqual(_infer_string_type_cached.cache_info().currsize, 0)
+
+        self.assertEqual(String.infer_type("  1  "), DataType.INTEGER)
+        self.assertEqual(String.infer_type("  1  "), DataType.INTEGER)
+        self.assertEqual(String.infer_type("  1  ", trim=False), DataType.STRING)
+        info = _infer_string_type_cached.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.currsize, 2)
+
+        # Non-string values are not cached
+        self.assertEqual(String.infer_type(1), DataType.INTEGER)
+        self.assertEqual(_infer_string_type_cached.cache_info().currsize, 2)
+
+        String.clear_infer_type_cache()
+        self.assertEqual(_infer_string_type_cached.cache_info().currsize, 0)
+
+    def test_parse_cache(self):
+        """Test that converters cache parsed strings after trimming"""
+        String.clear_parse_cache()
+
+        self.assertEqual(String.to_date("2023-01-01"), date(2023, 1, 1))
+        self.assertEqual(String.to_date(" 2023-01-01 "), date(2023, 1, 1))
+        self.assertIsNone(String.to_date(" 2023-01-01 ", trim=False))
+        info = _parse_date_cached.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.currsize, 2)
+
+        # Failed parses are cached too and still fall back to the default
+        self.assertEqual(String.to_time("invalid", default=time(1, 2)), time(1, 2))
+        self.assertEqual(String.to_time("invalid", default=time(3, 4)), time(3, 4))
+        self.assertEqual(_parse_time_cached.cache_info().hits, 1)
+
+        String.clear_parse_cache()
+        self.assertEqual(_parse_date_cached.cache_info().currsize, 0)
+        self.assertEqual(_parse_time_cached.cache_info().currsize, 0)
+
     def test_is_empty_like(self):
         """Test is_empty_like method."""
         # Test empty strings
@@ -579,6 +675,66 @@ class TestProfileValues(unittest.TestCase):
             profile_values(["  1  ", "  2  "], trim=False), DataType.STRING
         )
 
+        # Test that profiling stops as soon as the result must be MIXED
+        consumed = []
+
+        def values():
+            for value in ["1", "", "2.5", "abc", "1", "2"]:
+                consumed.append(value)
+                yield value
+
+        self.assertEqual(profile_values(values()), DataType.MIXED)
+        self.assertEqual(consumed, ["1", "", "2.5", "abc"])
+        self.assertEqual(profile_values([None, "", "true"]), DataType.MIXED)
+        self.assertEqual(profile_values(["1", "", "2.5", "", "3"]), DataType.FLOAT)
+
+        # Test tallying lists and tuples in batches of distinct values
+        with patch("splurge_tools.type_helper._PROFILE_BATCH_SIZE", 4):
+            self.assertEqual(profile_values(["1", "1", "", "1"] * 5 + ["2.5"]), DataType.FLOAT)
+            self.assertEqual(profile_values(tuple(["true", "true"] * 5)), DataType.BOOLEAN)
+            self.assertEqual(profile_values(["1", "1", "1", "1", "abc"]), DataType.MIXED)
+            self.assertEqual(profile_values([True, 1, 1, 1.0]), DataType.MIXED)
+            self.assertEqual(profile_values([[], [], "1"]), DataType.MIXED)
+
+        # Test array-like values converted through tolist()
+        self.assertEqual(profile_values(array("q", [1, 2, 3])), DataType.INTEGER)
+        self.assertEqual(profile_values(array("d", [1.5, 2.0])), DataType.FLOAT)
+        self.assertEqual(profile_values(array("q")), DataType.EMPTY)
+
+        # Test profiling the leading values plus a random sample of the rest
+        values = ["1"] * 1000 + ["2.5"] * 1000
+        self.assertEqual(profile_values(values, sample_size=10), DataType.FLOAT)
+        self.assertEqual(profile_values(iter(values), sample_size=10), DataType.FLOAT)
+        self.assertEqual(profile_values(["abc"] + values, sample_size=10), DataType.MIXED)
+        self.assertEqual(profile_values(["1", "2", "3"], sample_size=2), DataType.INTEGER)
+        with patch("splurge_tools.type_helper.random.sample", return_value=list(range(10, 15))):
+            self.assertEqual(profile_values(["1"] * 100 + ["abc"], sample_size=5), DataType.INTEGER)
+        with self.assertRaises(ValueError):
+            profile_values(values, sample_size=0)
+
+        # Test repeatable samples from a seeded generator, leaving the module-level one untouched
+        boundary_values = ["1"] * 100 + ["abc"] + ["1"] * 100
+        state = random.getstate()
+        for seed in range(20):
+            for make_values in (list, iter):
+                expected = profile_values(make_values(boundary_values), sample_size=5, rng=random.Random(seed))
+                self.assertEqual(
+                    profile_values(make_values(boundary_values), sample_size=5, rng=random.Random(seed)),
+                    expected
+                )
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(
+            _sample_values(iter(boundary_values), 5, random.Random(1)),
+            _sample_values(iter(boundary_values), 5, random.Random(1))
+        )
+
+        # Test bypassing the infer_type cache
+        String.clear_infer_type_cache()
+        self.assertEqual(profile_values(["1", "2.2", ""], no_cache=True), DataType.FLOAT)
+        self.assertEqual(_infer_string_type_cached.cache_info().currsize, 0)
+        self.assertEqual(profile_values(["1", "2.2", ""]), DataType.FLOAT)
+        self.assertEqual(_infer_string_type_cached.cache_info().currsize, 3)
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test cases for utility functions"""
@@ -614,24 +770,39 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertTrue(is_iterable({}))
         self.assertTrue(is_iterable("abc"))
         self.assertTrue(is_iterable((1, 2, 3)))
+        self.assertTrue(is_iterable(iter([1, 2, 3])))
+        self.assertTrue(is_iterable(value for value in range(3)))
 
         # Test non-iterable types
         self.assertFalse(is_iterable(None))
         self.assertFalse(is_iterable(123))
         self.assertFalse(is_iterable(True))
 
+        # Test iterability comes from the type, not its metaclass
+        self.assertTrue(is_iterable(DataType))
+        self.assertFalse(is_iterable(DataType.STRING))
+        self.assertFalse(is_iterable_not_string(DataType.STRING))
+
     def test_is_iterable_not_string(self):
         """Test non-string iterable detection"""
         # Test non-string iterables
         self.assertTrue(is_iterable_not_string([]))
         self.assertTrue(is_iterable_not_string({}))
         self.assertTrue(is_iterable_not_string((1, 2, 3)))
+        self.assertTrue(is_iterable_not_string(b"abc"))
 
         # Test strings and non-iterables
         self.assertFalse(is_iterable_not_string("abc"))
         self.assertFalse(is_iterable_not_string(None))
         self.assertFalse(is_iterable_not_string(123))
 
+        # Test subclasses keep the same answers as their builtin bases
+        class _Str(str):
+            pass
+
+        self.assertFalse(is_iterable_not_string(_Str("abc")))
+        self.assertTrue(is_iterable_not_string(OrderedDict()))
+
     def test_is_empty(self):
         """Test empty value detection"""
         # Test empty values
@@ -641,14 +812,64 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertTrue(is_empty([]))
         self.assertTrue(is_empty({}))
         self.assertTrue(is_empty(()))
+        self.assertTrue(is_empty(set()))
+        self.assertTrue(is_empty(frozenset()))
 
         # Test non-empty values
         self.assertFalse(is_empty("abc"))
         self.assertFalse(is_empty([1, 2, 3]))
         self.assertFalse(is_empty({"a": 1}))
+        self.assertFalse(is_empty(frozenset({1})))
         self.assertFalse(is_empty(0))
         self.assertFalse(is_empty(False))
 
+        # Test subclasses of the builtin types
+        self.assertTrue(is_empty(OrderedDict()))
+        self.assertFalse(is_empty(OrderedDict(a=1)))
+
+        class _Str(str):
+            pass
+
+        self.assertTrue(is_empty(_Str(" ")))
+        self.assertFalse(is_empty(_Str("abc")))
+
+        # Unsupported types are never tested for truthiness
+        class _Ambiguous:
+            def __bool__(self):
+                raise ValueError("truth value is ambiguous")
+
+        self.assertFalse(is_empty(_Ambiguous()))
+
+    def test_is_empty_str(self):
+        """Test empty string detection"""
+        for value in (None, "", " ", "\t\n", "abc", " a "):
+            self.assertEqual(is_empty_str(value), is_empty(value))
+
+    def test_is_empty_list(self):
+        """Test empty container detection"""
+        for value in (None, [], [1], (), (1,), set(), {}, {"a": 1}, frozenset()):
+            self.assertEqual(is_empty_list(value), is_empty(value))
+
+    def test_is_empty_many(self):
+        """Test batch empty value detection"""
+        values = ["abc", "", " ", None, [], [1], {}, (), frozenset(), 0, OrderedDict()]
+        self.assertEqual(is_empty_many(values), [is_empty(value) for value in values])
+        self.assertEqual(is_empty_many(iter(values)), [is_empty(value) for value in values])
+        self.assertEqual(is_empty_many([]), [])
+        self.assertEqual(bytes(is_empty_many(["a", "", " ", None])), b"\x00\x01\x01\x01")
+
+        # Test array-like values converted through tolist() and to_pylist()
+        self.assertEqual(is_empty_many(array("q", [0, 1])), [False, False])
+
+        class _Column:
+            def __iter__(self):
+                raise AssertionError("array-like columns should be converted, not iterated")
+
+            def to_pylist(self):
+                return ["", " ", "a", None]
+
+        self.assertEqual(is_empty_many(_Column()), [True, True, False, True])
+
 
 if __name__ == "__main__":
     unittest.main()